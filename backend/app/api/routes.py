@@ -194,8 +194,9 @@ def create_job(
     writer_persona = payload.writer_persona or (
         WriterPersona(**default_writer_payload) if default_writer_payload else None
     )
-    preferred_sources = payload.preferred_sources or project_defaults.get("preferred_sources", [])
-    reference_media = payload.reference_media or project_defaults.get("reference_media", [])
+    # The cached defaults hold tuples; JobCreate and the launch payload expect lists.
+    preferred_sources = list(payload.preferred_sources or project_defaults.get("preferred_sources", []))
+    reference_media = list(payload.reference_media or project_defaults.get("reference_media", []))
 
     resolved_payload_dict = payload.model_dump()
     if writer_persona:
@@ -275,8 +276,9 @@ def run_benchmark(
     writer_persona = payload.writer_persona or (
         WriterPersona(**default_writer_payload) if default_writer_payload else None
     )
-    preferred_sources = payload.preferred_sources or project_defaults.get("preferred_sources", [])
-    reference_media = payload.reference_media or project_defaults.get("reference_media", [])
+    # The cached defaults hold tuples; JobCreate and the launch payload expect lists.
+    preferred_sources = list(payload.preferred_sources or project_defaults.get("preferred_sources", []))
+    reference_media = list(payload.reference_media or project_defaults.get("reference_media", []))
 
     persona = payload.persona_override or ai_gateway.generate_persona(
         PersonaDeriveRequest(
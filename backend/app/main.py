@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .api.routes import router
 from .core.config import get_settings
 from .core.logger import configure_logging  # noqa: F401
+from .services.benchmark import shutdown_shared_executor
 
 settings = get_settings()
 
@@ -19,6 +20,12 @@ app.add_middleware(
 app.include_router(router)
 
 
+@app.on_event("shutdown")
+def release_pipeline_executor() -> None:
+    if shutdown_shared_executor is not None:
+        shutdown_shared_executor()
+
+
 @app.get("/healthz", include_in_schema=False)
 def healthcheck() -> dict:
     return {"status": "ok", "project_id": settings.project_id}
@@ -22,9 +22,10 @@ from ..models import (
 from ..services.firestore import FirestoreRepository
 
 try:  # Import the worker pipeline directly for local execution
-    from worker.app.tasks.pipeline import DraftGenerationPipeline
+    from worker.app.tasks.pipeline import DraftGenerationPipeline, shutdown_shared_executor
 except ImportError as exc:  # pragma: no cover - worker package may not be on PYTHONPATH
     DraftGenerationPipeline = None  # type: ignore
+    shutdown_shared_executor = None  # type: ignore
     PIPELINE_IMPORT_ERROR = exc
 else:
     PIPELINE_IMPORT_ERROR = None
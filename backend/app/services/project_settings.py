@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
 from shared.project_defaults import get_project_defaults
 
 
-def load_project_settings(project_id: str, expertise_level: Optional[str] = None) -> Dict[str, Any]:
+def load_project_settings(project_id: str, expertise_level: Optional[str] = None) -> Mapping[str, Any]:
     """Load project level defaults for the given project id.
 
+    The returned mapping is the shared, read-only cache entry; sources and media are tuples.
+
     Args:
         project_id: The project ID to get defaults for
         expertise_level: Optional expertise level to get appropriate sources and media
@@ -224,8 +224,15 @@ if [[ "$SERVICES" == *"worker"* ]]; then
   if [[ -n "$OPENAI_MODEL" ]]; then
     WORKER_ENV+=",OPENAI_MODEL=${OPENAI_MODEL}"
   fi
-  # Set parallel execution workers (default: 6 for better performance with 2 CPUs)
+  # Set parallel execution workers (default: 6 for better performance with 2 CPUs).
+  # This is a per-instance limit shared by all concurrent jobs and their side tasks, not per job.
   WORKER_ENV+=",LLM_MAX_WORKERS=${LLM_MAX_WORKERS:-6}"
+  # Generate all H3 paragraphs of an H2 in one request (falls back per H3 on bad JSON)
+  WORKER_ENV+=",BATCH_H3_PER_H2=${BATCH_H3_PER_H2:-false}"
+  # Reuse identical temperature-0 LLM responses across reruns (instance-local disk, expiring and size-capped)
+  WORKER_ENV+=",LLM_CACHE_ENABLED=${LLM_CACHE_ENABLED:-false}"
+  WORKER_ENV+=",LLM_CACHE_TTL_SECONDS=${LLM_CACHE_TTL_SECONDS:-86400}"
+  WORKER_ENV+=",LLM_CACHE_MAX_ENTRIES=${LLM_CACHE_MAX_ENTRIES:-2000}"
 
   deploy_cloud_run \
     "seo-drafter-worker" \
@@ -4,28 +4,40 @@ import logging
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
 try:  # pragma: no cover - optional dependency
+    from openai import DefaultHttpxClient as OpenAIHttpxClient
     from openai import OpenAI
     OPENAI_AVAILABLE = True
 except ImportError:  # pragma: no cover - local fallback
     OPENAI_AVAILABLE = False
     OpenAI = None  # type: ignore
+    OpenAIHttpxClient = None  # type: ignore
     logger.debug("openai package not available")
 
 try:  # pragma: no cover - optional dependency
     from anthropic import Anthropic
+    from anthropic import DefaultHttpxClient as AnthropicHttpxClient
     from anthropic.types import Message as AnthropicMessage
     ANTHROPIC_AVAILABLE = True
 except ImportError:  # pragma: no cover - local fallback
     Anthropic = None  # type: ignore
+    AnthropicHttpxClient = None  # type: ignore
     AnthropicMessage = Any  # type: ignore
     ANTHROPIC_AVAILABLE = False
     logger.debug("anthropic package not available")
 
+try:  # pragma: no cover - optional dependency (installed via httpx[http2])
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - local fallback
+    HTTP2_AVAILABLE = False
+    logger.debug("h2 package not available; LLM clients use HTTP/1.1 keep-alive")
+
 
 SUPPORTED_PROVIDERS = {"openai", "anthropic"}
 
@@ -60,6 +72,22 @@ def _clean_proxy_env() -> bool:
     return removed
 
 
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str) -> "OpenAI":
+    """Return a process-wide OpenAI client so gateways share one connection pool.
+
+    With ``h2`` installed, parallel paragraph requests are multiplexed over one HTTP/2
+    connection instead of paying a TLS handshake per pooled HTTP/1.1 connection.
+    """
+    return OpenAI(api_key=api_key, http_client=OpenAIHttpxClient(http2=HTTP2_AVAILABLE))
+
+
+@lru_cache(maxsize=4)
+def _anthropic_client(api_key: str) -> "Anthropic":
+    """Return a process-wide Anthropic client so gateways share one connection pool."""
+    return Anthropic(api_key=api_key, http_client=AnthropicHttpxClient(http2=HTTP2_AVAILABLE))
+
+
 def map_messages_to_anthropic(messages: Sequence[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
     """
     Convert OpenAI-style chat messages into Anthropic system/user blocks.
@@ -143,13 +171,13 @@ class LLMGateway:
                 raise ImportError("openai package is required. Install with: pip install openai")
             if not self._openai_api_key:
                 raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY.")
-            self._client = OpenAI(api_key=self._openai_api_key)
+            self._client = _openai_client(self._openai_api_key)
         elif self.provider == "anthropic":
             if not ANTHROPIC_AVAILABLE:
                 raise ImportError("anthropic package is required. Install with: pip install anthropic")
             if not self._anthropic_api_key:
                 raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY or CLAUDE_API_KEY.")
-            self._client = Anthropic(api_key=self._anthropic_api_key)
+            self._client = _anthropic_client(self._anthropic_api_key)
         else:  # pragma: no cover - guarded above
             raise ValueError(f"Unsupported provider: {self.provider}")
 
@@ -261,9 +289,15 @@ class LLMGateway:
         if self.provider == "anthropic":
             assert ANTHROPIC_AVAILABLE and self._client is not None  # for mypy
             system_prompt, anthropic_messages = map_messages_to_anthropic(messages)
+            # Mark the shared system/developer prefix as cacheable; only the user turn varies.
+            system_blocks = (
+                [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+                if system_prompt
+                else None
+            )
             response: AnthropicMessage = self._client.messages.create(
                 model=self.model,
-                system=system_prompt or None,
+                system=system_blocks,
                 messages=anthropic_messages,
                 temperature=temperature,
                 max_tokens=max_tokens or 1500,
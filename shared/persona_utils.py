@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict
 
 
@@ -39,30 +40,34 @@ def infer_japanese_persona_label(
     persona = persona or {}
     writer_persona = writer_persona or {}
 
-    expertise = str(persona.get("expertise_level") or fallback_expertise or "intermediate").lower()
-    years_label = EXPERTISE_YEARS.get(expertise, "")
+    audience_hint = writer_persona.get("audience") if isinstance(writer_persona, dict) else None
+    return _persona_label(
+        str(persona.get("expertise_level") or fallback_expertise or "intermediate").lower(),
+        str(persona.get("role") or persona.get("job_role") or "").lower(),
+        str(persona.get("label") or persona.get("name") or "").strip(),
+        audience_hint.strip() if isinstance(audience_hint, str) else "",
+    )
+
 
-    role = str(persona.get("role") or persona.get("job_role") or "").lower()
+@lru_cache(maxsize=256)
+def _persona_label(expertise: str, role: str, custom_label: str, audience_hint: str) -> str:
+    years_label = EXPERTISE_YEARS.get(expertise, "")
     role_label = ROLE_LABELS.get(role, "")
 
     # When persona explicitly specifies a custom label, prioritize it.
-    custom_label = str(persona.get("label") or persona.get("name") or "").strip()
     if custom_label and len(custom_label) <= 12 and not _looks_like_person_name(custom_label):
         role_label = custom_label
 
     if not role_label:
         # Use writer persona audience hint if available
-        audience_hint = writer_persona.get("audience") if isinstance(writer_persona, dict) else None
-        if isinstance(audience_hint, str) and audience_hint.strip():
-            role_label = audience_hint.strip()
-        else:
-            role_label = "担当者"
+        role_label = audience_hint or "担当者"
 
     if years_label:
         return f"{role_label}になって{years_label}の方"
     return f"{role_label}の方"
 
 
+@lru_cache(maxsize=256)
 def build_intro_persona_clause(persona_label: str) -> str:
     """
     日本のSEO記事標準の冒頭表現を生成。
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 
 @dataclass(frozen=True)
@@ -112,8 +114,6 @@ _PROJECT_DEFAULTS: Dict[str, ProjectDefaults] = {
                 "見出しや本文に「QUEST」「Q/U」「E/S」「T:」「リード文：」などのフレームワーク名・ラベルを絶対に出さないでください。"
             ),
             user=(
-                "見出し: {heading}\n"
-                "セクションレベル: {level}\n"
                 "主キーワード: {primary_keyword}\n"
                 "読者プロフィール: {reader_profile}\n"
                 "ライター特性: {writer_qualities}\n"
@@ -126,6 +126,8 @@ _PROJECT_DEFAULTS: Dict[str, ProjectDefaults] = {
                 "記事タイプ: {article_type}\n"
                 "検索意図: {intent}\n"
                 "差別化すべきトピック: {gap_topics}\n"
+                "見出し: {heading}\n"
+                "セクションレベル: {level}\n"
                 "このセクションで伝えたい狙い: {section_goal}\n"
             ),
         ),
@@ -171,8 +173,6 @@ BEGINNER_PROMPT_LAYERS = PromptLayerDefaults(
         "見出しや本文にQUEST/PREP/FAB/PASなどのテンプレ名や「Q/U:」「E/S:」「T:」「リード文：」といった内部ラベルを表示しないでください。"
     ),
     user=(
-        "見出し: {heading}\n"
-        "セクションレベル: {level}\n"
         "主キーワード: {primary_keyword}\n"
         "読者プロフィール: {reader_profile}\n"
         "ライター特性: {writer_qualities}\n"
@@ -180,6 +180,8 @@ BEGINNER_PROMPT_LAYERS = PromptLayerDefaults(
         "目標: {cta}\n"
         "参考URL: {references}\n"
         "記事タイプ: {article_type}\n"
+        "見出し: {heading}\n"
+        "セクションレベル: {level}\n"
         "このセクションで伝えたい狙い: {section_goal}\n"
         "\n"
         "初心者向けに、分かりやすく親しみやすい文章で書いてください。広く浅く要点を押さえ、詳細は別記事へ誘導します。"
@@ -220,8 +222,6 @@ INTERMEDIATE_PROMPT_LAYERS = PromptLayerDefaults(
         "フレームワーク名（QUEST/PREP/FAB/PAS等）や「Q/U:」「E/S:」「T:」などのラベルは本文・見出しに出さず、内部の構成ヒントとしてのみ扱ってください。"
     ),
     user=(
-        "見出し: {heading}\n"
-        "セクションレベル: {level}\n"
         "主キーワード: {primary_keyword}\n"
         "読者プロフィール: {reader_profile}\n"
         "ライター特性: {writer_qualities}\n"
@@ -231,6 +231,8 @@ INTERMEDIATE_PROMPT_LAYERS = PromptLayerDefaults(
         "優先参照メディア: {preferred_media}\n"
         "記事タイプ: {article_type}\n"
         "検索意図: {intent}\n"
+        "見出し: {heading}\n"
+        "セクションレベル: {level}\n"
         "このセクションで伝えたい狙い: {section_goal}\n"
     ),
 )
@@ -271,8 +273,6 @@ EXPERT_PROMPT_LAYERS = PromptLayerDefaults(
         "フレームワーク名（QUEST/PREP/FAB/PAS等）や「Q/U:」「E/S:」「T:」「リード文：」などのラベルを本文・見出しに出さず、内部の構成ヒントとしてのみ扱ってください。"
     ),
     user=(
-        "見出し: {heading}\n"
-        "セクションレベル: {level}\n"
         "主キーワード: {primary_keyword}\n"
         "読者プロフィール: {reader_profile}\n"
         "ライター特性: {writer_qualities}\n"
@@ -285,19 +285,23 @@ EXPERT_PROMPT_LAYERS = PromptLayerDefaults(
         "記事タイプ: {article_type}\n"
         "検索意図: {intent}\n"
         "差別化すべきトピック: {gap_topics}\n"
+        "見出し: {heading}\n"
+        "セクションレベル: {level}\n"
         "このセクションで伝えたい狙い: {section_goal}\n"
     ),
 )
 
 
+_PROMPT_LAYERS_BY_EXPERTISE = {
+    "beginner": BEGINNER_PROMPT_LAYERS,
+    "intermediate": INTERMEDIATE_PROMPT_LAYERS,
+    "expert": EXPERT_PROMPT_LAYERS,
+}
+
+
 def get_prompt_layers_for_expertise(expertise_level: str) -> PromptLayerDefaults:
     """Return prompt layers based on expertise level."""
-    expertise_map = {
-        "beginner": BEGINNER_PROMPT_LAYERS,
-        "intermediate": INTERMEDIATE_PROMPT_LAYERS,
-        "expert": EXPERT_PROMPT_LAYERS,
-    }
-    return expertise_map.get(expertise_level, INTERMEDIATE_PROMPT_LAYERS)
+    return _PROMPT_LAYERS_BY_EXPERTISE.get(expertise_level, INTERMEDIATE_PROMPT_LAYERS)
 
 
 # Expertise-level specific sources and media
@@ -365,13 +369,22 @@ def get_sources_and_media_for_expertise(expertise_level: str) -> Dict[str, List[
     return expertise_map.get(expertise_level, expertise_map["intermediate"])
 
 
-def get_project_defaults(project_id: Optional[str], expertise_level: Optional[str] = None) -> Dict[str, Any]:
+def get_project_defaults(project_id: Optional[str], expertise_level: Optional[str] = None) -> Mapping[str, Any]:
     """Return defaults for the requested project, or the first registered defaults.
 
+    The result is cached per (project_id, expertise_level) and shared between callers:
+    sources and media are tuples, prompt layers a read-only mapping, and the writer
+    persona must be copied before it is mutated.
+
     Args:
         project_id: The project ID to get defaults for
         expertise_level: Optional expertise level to override sources and media
     """
+    return _cached_project_defaults(project_id, expertise_level)
+
+
+@lru_cache(maxsize=128)
+def _cached_project_defaults(project_id: Optional[str], expertise_level: Optional[str]) -> Mapping[str, Any]:
     if project_id and project_id in _PROJECT_DEFAULTS:
         defaults = _PROJECT_DEFAULTS[project_id].to_payload()
     elif _PROJECT_DEFAULTS:
@@ -395,4 +408,10 @@ def get_project_defaults(project_id: Optional[str], expertise_level: Optional[st
         defaults["preferred_sources"] = sources_and_media["preferred_sources"]
         defaults["reference_media"] = sources_and_media["reference_media"]
 
-    return defaults
+    # Freeze the shared entry so every caller can read it without copying. The
+    # writer persona stays a plain dict because it is JSON-serialized downstream,
+    # so callers that keep it per job must take their own copy.
+    defaults["preferred_sources"] = tuple(defaults["preferred_sources"])
+    defaults["reference_media"] = tuple(defaults["reference_media"])
+    defaults["prompt_layers"] = MappingProxyType(dict(defaults["prompt_layers"]))
+    return MappingProxyType(defaults)
@@ -24,7 +24,13 @@ class Settings(BaseSettings):
     openai_model: str = Field(default="gpt-5", alias="OPENAI_MODEL")
     anthropic_api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
     anthropic_model: str = Field(default="claude-sonnet-4-5", alias="ANTHROPIC_MODEL")
+    # Size of the process-wide LLM pool, shared by all concurrent jobs and their side tasks.
     llm_max_workers: int = Field(default=4, alias="LLM_MAX_WORKERS")
+    batch_h3_per_h2: bool = Field(default=False, alias="BATCH_H3_PER_H2")
+    llm_cache_enabled: bool = Field(default=False, alias="LLM_CACHE_ENABLED")
+    llm_cache_dir: str = Field(default="/tmp/llm_cache", alias="LLM_CACHE_DIR")
+    llm_cache_ttl_seconds: int = Field(default=86400, alias="LLM_CACHE_TTL_SECONDS")
+    llm_cache_max_entries: int = Field(default=2000, alias="LLM_CACHE_MAX_ENTRIES")
     log_prompts: bool = Field(default=False, alias="LOG_PROMPTS")
     log_prompts_max_chars: int = Field(default=2000, alias="LOG_PROMPTS_MAX_CHARS")
     log_prompts_severity: str = Field(default="INFO", alias="LOG_PROMPTS_SEVERITY")
@@ -2,12 +2,17 @@ import logging
 
 from fastapi import FastAPI, HTTPException
 
-from .tasks.pipeline import DraftGenerationPipeline
+from .tasks.pipeline import DraftGenerationPipeline, shutdown_shared_executor
 
 app = FastAPI(title="SEO Drafter Worker", version="0.1.0")
 logger = logging.getLogger(__name__)
 
 
+@app.on_event("shutdown")
+def release_pipeline_executor() -> None:
+    shutdown_shared_executor()
+
+
 @app.post("/run-pipeline")
 def run_pipeline(payload: dict) -> dict:
     pipeline = DraftGenerationPipeline()
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
 import json
 import logging
 import os
 import re
+import string
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
+import traceback
+import uuid
+from collections import ChainMap, Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Sequence, Tuple
+from urllib.parse import quote_plus
+
+from cachetools import TTLCache
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib decoder
+    orjson = None
 
 from shared.internal_links import InternalLinkRepository
 from shared.persona_utils import build_intro_persona_clause, infer_japanese_persona_label
@@ -28,8 +44,271 @@ from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Internal link lookups are shared across pipeline instances so that a burst of
+# jobs on the same keyword/persona goals reuses a single BigQuery query.
+_LINK_SEARCH_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_LINK_SEARCH_LOCK = threading.Lock()
+
+# Approximate entry count per LLM response cache directory, so eviction only rescans
+# the directory when the count says the cap may have been crossed.
+_RESPONSE_CACHE_COUNTS: Dict[str, int] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Namespace for deterministic, fixed-width claim IDs derived from draft_id + heading.
+_CLAIM_ID_NAMESPACE = uuid.UUID("671f2fc7-9233-5544-8de8-39b218b581cc")
+
+_NUM_RE = re.compile(r"\d+")
+_KEY_POINT_SPLIT_RE = re.compile(r"[,、，\n]+")
+_TOHA_SUFFIX_RE = re.compile(r"(?:\s|　)*(?:とは)+(?:[?？]*)$")
+_TOHA_ANY_RE = re.compile(r"(?:とは|[?？])+")
+_GLOSSARY_SUFFIX_RE = re.compile(r"とは[?？]*$")
+_JSON_FENCE_OPEN_RE = re.compile(r"^```(?:json)?", re.IGNORECASE)
+_NUMERIC_FACT_RE = re.compile(r"\d+[\d,\.]*")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_SENTENCE_END_RE = re.compile(r"[。！!？?]")
+_INTRO_PHRASE_RE = re.compile(r"(この記事|本記事|読み終わると|わかること)")
+_EXAMPLE_PHRASE_RE = re.compile(r"(例|事例|ケース|例えば)")
+# Same line boundaries as str.splitlines().
+_LINE_RE = re.compile("[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]+")
+
+_SEARCH_FALLBACK_PREFIX = "https://www.google.com/search?q="
+
+# Word budgets for template H3s and the injected conclusion section.
+_MIN_H3_WORD_BUDGET = 120
+_CONCLUSION_SECTION_WORDS = 260
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep catching ValueError.
+_loads_json = orjson.loads if orjson else json.loads
+
+
+def _dumps_json(value: Any) -> str:
+    """Serialize to compact UTF-8 JSON text, using orjson when it can encode the value."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False)
+
+
+# Fixed part of the refine_draft prompt; the conclusion clause and draft JSON follow it.
+_REFINE_INSTRUCTION = (
+    "あなたはシニアSEO編集長です。以下のJSONで渡すドラフトを推敲し、"
+    "論理構成・重複・専門用語・結論との整合性を整えてください。\n\n"
+    "必ず下記のフォーマットでJSONのみを出力してください:\n"
+    "{\n"
+    '  "sections": [\n'
+    '    {"h2": "見出し", "paragraphs": [{"text": "本文", "citations": ["..."]}]}\n'
+    "  ],\n"
+    '  "faq": [{"question": "...", "answer": "..."}],\n'
+    '  "claims": [{"id": "...", "text": "...", "citations": ["..."]}],\n'
+    '  "refinement_notes": ["修正内容のメモ"]\n'
+    "}\n\n"
+    "- 見出し数は必要に応じて微調整しても良いが、情報は削りすぎない\n"
+    "- 数値・引用URLは可能な限り保持し、変更した場合は notes に理由を書く\n"
+    "- 各 paragraph は具体的で重複のない文章にする\n"
+    "- FAQ/claims は要点のみ残し、不要な重複は削除\n"
+    "- refinement_notes にはユーザーが後から理解できる粒度で修正理由を列挙\n\n"
+    "- 見出しや本文に含まれるテンプレートのラベル（例:「リード文：」「Q/U:」「E/S:」「T:」「QUESTで提示」など）やフレームワーク名（QUEST/PREP/FAB/PAS等）は削除または自然な文章に置き換える\n"
+    "- Markdownの見出しレベルはH1をタイトルのみに1回だけ使用し、本文中はH2/H3のみを用いる。複数のH1があれば適切にH2/H3へ下げる。H2タイトルが重複する場合は内容が分かるよう具体的に書き換えてユニークにする\n"
+    "- 同じ内容を繰り返す段落は統合・削除し、各セクションが指定レンジに収まるよう過剰な部分は簡潔に要約する\n"
+    "- 「◯◯とは〜」のような定義文が複数回出る場合は、冒頭の定義だけ残し、以降は「この取り組み」「デジタル施策」などに言い換えて重複を避ける\n"
+    "- B2Cの例を挙げた場合はすぐ後に「B2Bでは〜」と1文で橋渡しを入れ、事例の7割以上をB2B（SaaS/製造業/法人向けサービス等）から選ぶ\n"
+    "- 1文に読点が3つ以上あるなど長すぎる場合は意味の切れ目で2〜3文に分割し、専門用語は初出のみ簡単な言い換え＋例を添える\n"
+    "- 数値は公的機関や一次情報を優先し、不確かなものは「約」「〜程度」にとどめる。1セクションあたりの数値は1〜3個に抑え、変更した場合は理由をnotesに記載\n\n"
+)
+
+_SECTION_BATCH_INSTRUCTION = (
+    "このH2セクションに含まれる以下の{count}個のH3見出しについて、それぞれの本文を執筆してください。\n"
+    "見出しの順序と数は変えず、JSONのみで返してください。"
+    '形式: {{"paragraphs": [{{"heading": "H3見出し", "text": "本文"}}]}}\n'
+    "{headings}"
+)
+
+
+# JSON-decoded citations are either plain objects or bare URL strings.
+_CITATION_BUILDERS = {
+    dict: lambda item: item,
+    str: lambda item: {"url": item},
+}
+
+
+def _clean_strs(items: Sequence[Any]) -> List[str]:
+    """Stringify and strip each item once, dropping empty results."""
+    return [text for text in (str(item).strip() for item in items) if text]
+
+
+def _clone_json(value: Any) -> Any:
+    """Copy JSON-shaped data (dicts/lists of scalars) without deepcopy's memo bookkeeping."""
+    if isinstance(value, dict):
+        return {key: _clone_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_json(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _section_word_budget(word_count_range: str, section_count: int) -> int:
+    numbers = [int(num) for num in _NUM_RE.findall(word_count_range)]
+    if not numbers:
+        return 300
+    average = sum(numbers) / len(numbers)
+    return max(int(average / max(section_count, 1)), 200)
+
+
+@functools.lru_cache(maxsize=4096)
+def _search_fallback_url(keyword: str) -> str:
+    return _SEARCH_FALLBACK_PREFIX + quote_plus(keyword)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_gateway(
+    provider: str,
+    model: str,
+    openai_api_key: Optional[str],
+    anthropic_api_key: Optional[str],
+) -> "OpenAIGateway":
+    """Return a process-wide gateway for the given provider/model pair."""
+    return OpenAIGateway(
+        api_key=openai_api_key,
+        model=model,
+        search_enabled=True,
+        provider=provider,
+        anthropic_api_key=anthropic_api_key,
+    )
+
+
+_SHARED_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+_SHARED_EXECUTOR_THREAD = threading.local()
+
+
+def _mark_shared_executor_thread() -> None:
+    _SHARED_EXECUTOR_THREAD.active = True
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool that bounds concurrent LLM calls across all jobs.
+
+    LLM_MAX_WORKERS sizes this pool, so it limits the whole process (every concurrent job
+    and its side tasks together), not each job.
+    """
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        if _SHARED_EXECUTOR is None:
+            max_workers = max(int(getattr(get_settings(), "llm_max_workers", 4) or 4), 1)
+            _SHARED_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="draftgen",
+                initializer=_mark_shared_executor_thread,
+            )
+        return _SHARED_EXECUTOR
+
+
+def shutdown_shared_executor() -> None:
+    """Drain and release the shared pool; the next pipeline call starts a fresh one."""
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        executor, _SHARED_EXECUTOR = _SHARED_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+_LINK_REPOSITORY: Optional[InternalLinkRepository] = None
+_LINK_REPOSITORY_RETRY_AT = 0.0
+_LINK_REPOSITORY_RETRY_SECONDS = 60.0
+_LINK_REPOSITORY_LOCK = threading.Lock()
+
+
+def _get_link_repository() -> InternalLinkRepository:
+    """Return the process-wide internal link repository (one BigQuery client per worker).
+
+    A repository whose client failed to initialise is only reused until the retry
+    interval passes, so a transient auth or network error does not disable links for good.
+    """
+    global _LINK_REPOSITORY, _LINK_REPOSITORY_RETRY_AT
+    with _LINK_REPOSITORY_LOCK:
+        repository = _LINK_REPOSITORY
+        if repository is None or (not repository.is_enabled and time.monotonic() >= _LINK_REPOSITORY_RETRY_AT):
+            repository = InternalLinkRepository()
+            _LINK_REPOSITORY = repository
+            _LINK_REPOSITORY_RETRY_AT = time.monotonic() + _LINK_REPOSITORY_RETRY_SECONDS
+        return repository
+
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _editor_checklist_template() -> str:
+    """Load the editor checklist template once per process."""
+    template_path = Path(__file__).resolve().parents[3] / "shared" / "prompts" / "editor_checklist.txt"
+    try:
+        return template_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return "自動検出された警告:\n{{VALIDATION_WARNINGS}}"
+
+
+# Prompt fields that change with every heading; everything else is fixed per draft.
+_PER_HEADING_FIELDS = frozenset({"heading", "level", "section_goal"})
+
+
+@functools.lru_cache(maxsize=64)
+def _template_fields(template: str) -> Optional[frozenset]:
+    """Return the top-level replacement field names used by a format template."""
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    return frozenset(re.split(r"[.\[]", name, maxsplit=1)[0] for _, name, _, _ in parsed if name is not None)
+
+
+def _prerender_layer(template: str, base_payload: Mapping[str, str], heading_fields: frozenset) -> Optional[str]:
+    """Format a prompt layer up front when it only uses draft-level fields."""
+    if not template:
+        return ""
+    fields = _template_fields(template)
+    if fields is None or fields & heading_fields:
+        return None
+    try:
+        return template.format_map(base_payload)
+    except (KeyError, IndexError, ValueError, AttributeError):
+        # Leave malformed templates to the per-heading path so errors surface as before.
+        return None
+
+
+def _split_layer(
+    template: str, base_payload: Mapping[str, str], heading_fields: frozenset
+) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """Pre-render the draft-level parts of a layer around its per-heading fields.
+
+    Returns ``(text, slot)`` pairs where ``slot`` is a single-field format string to fill
+    per heading (empty for the trailing text), or None when the template has to be
+    formatted as a whole.
+    """
+    if not template:
+        return ()
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    parts: List[Tuple[str, str]] = []
+    text = ""
+    try:
+        for literal, name, spec, conversion in parsed:
+            text += literal
+            if name is None:
+                continue
+            field = "{" + name + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}"
+            if re.split(r"[.\[]", name, maxsplit=1)[0] in heading_fields:
+                parts.append((text, field))
+                text = ""
+            else:
+                text += field.format_map(base_payload)
+    except (KeyError, IndexError, ValueError, AttributeError):
+        return None
+    parts.append((text, ""))
+    return tuple(parts)
+
+
+@dataclass(slots=True, frozen=True)
 class PipelineContext:
     job_id: str
     draft_id: str
@@ -51,7 +330,7 @@ class PipelineContext:
     preferred_sources: List[str]
     reference_media: List[str]
     project_template_id: Optional[str]
-    prompt_layers: Dict[str, str]
+    prompt_layers: Mapping[str, str]
     llm_provider: str
     llm_model: str
     llm_temperature: float
@@ -64,11 +343,483 @@ class PipelineContext:
     keyword_preset: Optional[str] = None  # e.g., "glossary" for 「◯◯とは」 intent
 
 
+# Quality-evaluation constants (article types that require citations, rubric topic vocabularies).
+_YMYL_TYPES = frozenset({"information", "comparison"})
+_HEADING_COVERAGE_KEYS: Tuple[str, ...] = ("チャネル", "施策", "KPI", "成功", "失敗", "まとめ")
+
+_FOUNDATIONAL_TERMS: Tuple[str, ...] = (
+    "SEO",
+    "コンテンツ",
+    "オウンド",
+    "SNS",
+    "メール",
+    "MA",
+    "マーケティングオートメーション",
+    "チャネル",
+    "施策",
+    "ファネル",
+)
+_MEASUREMENT_TERMS: Tuple[str, ...] = (
+    "GA4",
+    "Google広告",
+    "広告",
+    "計測",
+    "トラッキング",
+    "タグ",
+    "P-Max",
+    "PMax",
+    "アトリビューション",
+    "コンバージョン",
+    "BigQuery",
+    "DDA",
+)
+
+
+# Outline skeletons per article type: (h2 text, purpose, ((h3 text, purpose, role tags), ...)).
+# Texts may reference {keyword} / {keyword_surface}; _render_template_spec fills them per keyword.
+_H3Spec = Tuple[str, str, Tuple[str, ...]]
+_SectionSpec = Tuple[str, str, Tuple[_H3Spec, ...]]
+
+_BEGINNER_INFORMATION_SPEC: Tuple[_SectionSpec, ...] = (
+    (
+        "{keyword_surface}とは何か？今さら聞けない基礎を整理する",
+        "Lead",
+        (
+            ("いま抱えている悩みと、放置すると起きること", "LeadQuest", ("QUEST:Q", "JOURNEY:認知")),
+            ("{keyword_surface}で得られる価値とこの記事の流れ", "LeadQuest", ("QUEST:S", "JOURNEY:認知")),
+            ("読み終えたあとに実践できる一歩", "LeadQuest", ("QUEST:T", "JOURNEY:意思決定")),
+        ),
+    ),
+    (
+        "{keyword_surface}とは何か（定義と従来マーケとの違い）",
+        "Definition",
+        (
+            ("{keyword_surface}の定義を一文で明示", "Definition", ("QUEST:S",)),
+            ("従来マーケとの違いと役割分担", "Difference", ("JOURNEY:認知",)),
+            ("向いているケース・向かないケース", "FitUnfit", ("JOURNEY:比較",)),
+        ),
+    ),
+    (
+        "いま{keyword_surface}が重要になっている背景",
+        "Context",
+        (
+            ("市場環境や顧客行動の変化", "MarketShift", ("QUEST:U", "JOURNEY:認知")),
+            ("法規制・技術トレンド（Cookie/個人情報保護など）", "Regulation", ("QUEST:U",)),
+            ("オフライン施策との役割分担", "OfflineRole", ("JOURNEY:検討",)),
+        ),
+    ),
+    (
+        "主な施策・チャネルの種類と役割",
+        "Channels",
+        (
+            ("自社サイト/SEO/コンテンツマーケの基礎", "OwnedSeo", ("VAK:V",)),
+            ("広告・SNSでの集客と向き不向き", "AdsSNS", ("JOURNEY:認知",)),
+            ("メール/MA/ウェビナーなど育成施策", "Nurture", ("JOURNEY:検討",)),
+        ),
+    ),
+    (
+        "成功させるためのポイント・KPI設計",
+        "KPI",
+        (
+            ("ファネル別のKPIと計測の考え方", "FunnelKPI", ("VAK:K",)),
+            ("組織・体制づくりとリソース配分", "Org", ("JOURNEY:検討",)),
+            ("ツール活用は代表例のみ挙げ、設定手順は避ける", "ToolsLight", ("VAK:K",)),
+        ),
+    ),
+    (
+        "よくある失敗パターンと対策",
+        "Risk",
+        (
+            ("チャネルごとの部分最適・計測偏重になりがち", "ChannelSilod", ("QUEST:E",)),
+            ("ターゲット/メッセージのずれ", "MessageMismatch", ("QUEST:E",)),
+            ("短期で判断しすぎる/データの読み違い", "ShortTerm", ("QUEST:E",)),
+        ),
+    ),
+    (
+        "まとめと今日から取れる一歩（{keyword_surface}の活かし方）",
+        "Close",
+        (
+            ("主要ポイントの振り返り", "Recap", ("QUEST:T",)),
+            ("すぐに試せる1アクションとCTA", "Action", ("QUEST:T", "JOURNEY:意思決定")),
+        ),
+    ),
+)
+
+_BEGINNER_COMPARISON_SPEC: Tuple[_SectionSpec, ...] = (
+    (
+        "30秒で要点：この記事で分かること",
+        "Summary",
+        (
+            ("おすすめTOP3の結論", "Summary", ()),
+            ("選び方の基準", "Quick", ()),
+        ),
+    ),
+    (
+        "{keyword_surface}を選ぶポイントを3軸で解説",
+        "Introduction",
+        (
+            ("何を基準に選べばいい？", "Criteria", ()),
+            ("初心者が気をつけるべきこと", "Caution", ()),
+        ),
+    ),
+    (
+        "おすすめTOP3の比較",
+        "Comparison",
+        (
+            ("1位：これが一番おすすめの理由", "Top1", ()),
+            ("2位・3位：他の選択肢", "Top23", ()),
+        ),
+    ),
+    (
+        "使う人別のおすすめ",
+        "Segmentation",
+        (
+            ("初めて使う人向け", "Beginner", ()),
+            ("予算を抑えたい人向け", "Budget", ()),
+        ),
+    ),
+    (
+        "まとめ：{keyword_surface}を始めてみよう",
+        "Close",
+        (
+            ("次にやってみること", "NextAction", ()),
+        ),
+    ),
+)
+
+_BEGINNER_RANKING_SPEC: Tuple[_SectionSpec, ...] = (
+    (
+        "30秒で要点：ランキング結果",
+        "Summary",
+        (
+            ("TOP3のハイライト", "Highlight", ()),
+            ("どうやってランク付けしたの？", "Method", ()),
+        ),
+    ),
+    (
+        "1位から3位を詳しく紹介",
+        "Review",
+        (
+            ("第1位：おすすめポイントと特徴", "Rank1", ()),
+            ("第2位・第3位の良いところ", "Rank23", ()),
+        ),
+    ),
+    (
+        "あなたに合うのはどれ？",
+        "Segmentation",
+        (
+            ("こんな人には1位がおすすめ", "Type1", ()),
+            ("こんな人には2位・3位がおすすめ", "Type23", ()),
+        ),
+    ),
+    (
+        "よくある失敗と対策",
+        "Risk",
+        (
+            ("初心者がつまずきやすいポイント", "Mistakes", ()),
+            ("お得に始める方法", "Deals", ()),
+        ),
+    ),
+    (
+        "まとめと次のステップ",
+        "Close",
+        (
+            ("次にやってみること", "NextAction", ()),
+        ),
+    ),
+)
+
+_INFORMATION_SPEC: Tuple[_SectionSpec, ...] = (
+    (
+        "結論: {keyword_surface}で実現できる成果と次のアクション",
+        "Summary",
+        (
+            ("最優先で押さえるべき成功条件", "Summary", ()),
+            ("効果検証に用いる主要指標", "Summary", ()),
+        ),
+    ),
+    (
+        "背景と課題: なぜいま取り組む必要があるのか",
+        "Context",
+        (
+            ("読者が直面する具体的な課題シナリオ", "Context", ()),
+            ("関連する市場動向・法規制", "Context", ()),
+        ),
+    ),
+    (
+        "根拠と仕組み: 成果を支えるメカニズム",
+        "Mechanism",
+        (
+            ("一次情報・統計で裏付ける効果", "Mechanism", ()),
+            ("仕組み・プロセスの分解と要点", "Mechanism", ()),
+        ),
+    ),
+    (
+        "実践ステップ: 再現性のある進め方",
+        "Execution",
+        (
+            ("着手前に整える前提条件", "Execution", ()),
+            ("ステップごとのタスクと注意点", "Execution", ()),
+        ),
+    ),
+    (
+        "事例と比較: 選択肢ごとの成果と向き・不向き",
+        "Case",
+        (
+            ("成功事例で確認できた定量的成果", "Case", ()),
+            ("他手法との違いと併用パターン", "Case", ()),
+        ),
+    ),
+    (
+        "リスクと対策: つまずきポイントの予防策",
+        "Risk",
+        (
+            ("よくある失敗パターンと兆候", "Risk", ()),
+            ("リカバリーと継続改善のチェックリスト", "Risk", ()),
+        ),
+    ),
+    (
+        "まとめと次のステップ",
+        "Close",
+        (
+            ("本記事で押さえた主要論点の整理", "Close", ()),
+            ("今後の検討で確認すべき追加情報", "Close", ()),
+        ),
+    ),
+)
+
+_COMPARISON_SPEC: Tuple[_SectionSpec, ...] = (
+    (
+        "結論: {keyword}のおすすめと評価サマリー",
+        "Summary",
+        (
+            ("最優先で検討すべき候補と理由", "Summary", ()),
+            ("評価に用いた基準の概要", "Summary", ()),
+        ),
+    ),
+    (
+        "評価軸と選定基準",
+        "Criteria",
+        (
+            ("比較項目（機能・価格・サポート等）", "Criteria", ()),
+            ("用途別に優先すべき指標", "Criteria", ()),
+        ),
+    ),
+    (
+        "主要候補の比較表と要点",
+        "Comparison",
+        (
+            ("TOP3製品の特徴と向いているケース", "Comparison", ()),
+            ("定量データで見る強み・弱み", "Comparison", ()),
+        ),
+    ),
+    (
+        "用途別・規模別の向き不向き",
+        "Segmentation",
+        (
+            ("小規模チーム／初導入でのポイント", "Segmentation", ()),
+            ("エンタープライズ・高機能ニーズの場合", "Segmentation", ()),
+        ),
+    ),
+    (
+        "価格・導入難易度・サポート体制",
+        "Operations",
+        (
+            ("料金体系と総コストの比較", "Operations", ()),
+            ("導入期間・必要リソース・サポート", "Operations", ()),
+        ),
+    ),
+    (
+        "検討時の注意点と確認項目",
+        "Risk",
+        (
+            ("想定されるリスクとチェックリスト", "Risk", ()),
+            ("契約前に確認すべき一次情報", "Risk", ()),
+        ),
+    ),
+    (
+        "まとめと調達に向けた次アクション",
+        "Close",
+        (
+            ("意思決定を進めるための準備物", "Close", ()),
+            ("出典・比較データの参照先", "Close", ()),
+        ),
+    ),
+)
+
+_RANKING_SPEC: Tuple[_SectionSpec, ...] = (
+    (
+        "結論: {keyword}ランキングのハイライト",
+        "Summary",
+        (
+            ("評価方法とTOP3の総評", "Summary", ()),
+            ("読者タイプ別のおすすめ候補", "Summary", ()),
+        ),
+    ),
+    (
+        "ランクインの評価軸とスコア",
+        "Criteria",
+        (
+            ("主要指標と計測方法", "Criteria", ()),
+            ("データソースと出典", "Criteria", ()),
+        ),
+    ),
+    (
+        "TOP3の詳細レビュー",
+        "Review",
+        (
+            ("第1位の概要と導入メリット", "Review", ()),
+            ("第2位・第3位の特徴と適合シーン", "Review", ()),
+        ),
+    ),
+    (
+        "用途別・業界別のおすすめ",
+        "Segmentation",
+        (
+            ("コスト重視の選択肢", "Segmentation", ()),
+            ("機能・サポート重視の選択肢", "Segmentation", ()),
+        ),
+    ),
+    (
+        "導入時の注意点とチェックリスト",
+        "Risk",
+        (
+            ("よくある失敗ポイント", "Risk", ()),
+            ("契約・運用で確認したい事項", "Risk", ()),
+        ),
+    ),
+    (
+        "資料・比較表と次アクション",
+        "Close",
+        (
+            ("ダウンロード資料・出典リンク", "Close", ()),
+            ("社内で検討を進める際のTips", "Close", ()),
+        ),
+    ),
+)
+
+_CLOSING_SPEC: Tuple[_SectionSpec, ...] = (
+    (
+        "結論: {keyword}導入で得られる成果の再確認",
+        "Summary",
+        (
+            ("意思決定を後押しする定量的根拠", "Summary", ()),
+            ("導入後のロードマップ概要", "Summary", ()),
+        ),
+    ),
+    (
+        "導入プロセスと成功条件",
+        "Execution",
+        (
+            ("短期導入ステップと役割分担", "Execution", ()),
+            ("成功事例から学ぶ運用ポイント", "Execution", ()),
+        ),
+    ),
+    (
+        "ROIとリスクコントロール",
+        "Finance",
+        (
+            ("投資対効果を示す数値・試算", "Finance", ()),
+            ("リスクとコンプライアンス対応", "Finance", ()),
+        ),
+    ),
+    (
+        "クロージング: 契約・導入に向けた次アクション",
+        "Close",
+        (
+            ("比較検討の最終チェックリスト", "Close", ()),
+            ("社内稟議資料で押さえるべき要素", "Close", ()),
+        ),
+    ),
+)
+
+# Beginner templates are tuned for 「◯◯とは」 intent; intermediate and expert share one structure.
+_TEMPLATE_SPECS: Dict[str, Dict[str, Tuple[_SectionSpec, ...]]] = {
+    "beginner": {
+        "information": _BEGINNER_INFORMATION_SPEC,
+        "comparison": _BEGINNER_COMPARISON_SPEC,
+        "ranking": _BEGINNER_RANKING_SPEC,
+        "closing": _BEGINNER_INFORMATION_SPEC,
+    },
+    "default": {
+        "information": _INFORMATION_SPEC,
+        "comparison": _COMPARISON_SPEC,
+        "ranking": _RANKING_SPEC,
+        "closing": _CLOSING_SPEC,
+    },
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _render_template_spec(
+    tier: str,
+    article_type: str,
+    keyword: str,
+    keyword_surface: str,
+) -> Tuple[_SectionSpec, ...]:
+    """Fill keyword placeholders once per (template, keyword); literal texts pass through untouched."""
+
+    def fill(text: str) -> str:
+        return text.format(keyword=keyword, keyword_surface=keyword_surface) if "{" in text else text
+
+    return tuple(
+        (
+            fill(text),
+            purpose,
+            tuple((fill(h3_text), h3_purpose, role_tags) for h3_text, h3_purpose, role_tags in h3_specs),
+        )
+        for text, purpose, h3_specs in _TEMPLATE_SPECS[tier][article_type]
+    )
+
+
+def _materialize_template(spec: Tuple[_SectionSpec, ...]) -> List[Dict[str, Any]]:
+    """Expand a rendered template spec into fresh, mutable outline sections."""
+    sections: List[Dict[str, Any]] = []
+    for text, purpose, h3_specs in spec:
+        h3_items: List[Dict[str, Any]] = []
+        for h3_text, h3_purpose, role_tags in h3_specs:
+            item: Dict[str, Any] = {"text": h3_text, "purpose": h3_purpose}
+            if role_tags:
+                item["role_tags"] = list(role_tags)
+            h3_items.append(item)
+        sections.append(
+            {
+                "id": f"sec{len(sections)+1}",
+                "level": "h2",
+                "text": text,
+                "purpose": purpose,
+                "section_goal": None,
+                "h3": h3_items,
+            }
+        )
+    return sections
+
+
+@dataclass(slots=True, frozen=True)
+class PromptStatic:
+    """Per-draft prompt inputs that do not depend on the heading being written."""
+
+    prompt_layers: Dict[str, str]
+    reader_name: str
+    mission_clause: str
+    is_b2b: bool
+    base_payload: Dict[str, str]
+    # Layers that do not reference per-heading fields are rendered once per draft;
+    # None means the layer must be formatted for every heading.
+    system_message: Optional[str]
+    developer_message: Optional[str]
+    # The user layer always names the heading, so only its draft-level parts are rendered
+    # up front (see _split_layer); None falls back to formatting the whole template.
+    user_parts: Optional[Tuple[Tuple[str, str], ...]]
+
+
 class DraftGenerationPipeline:
     """Encapsulates the deterministic order of the draft generation steps."""
 
     def __init__(self) -> None:
         self.settings = get_settings()
+        self._default_prompt_version = self.settings.default_prompt_version
+        self._default_project_id = self.settings.project_id
         self.max_workers = max(int(getattr(self.settings, "llm_max_workers", 4) or 4), 1)
         self.ai_gateway = None
         self._active_llm: Dict[str, Any] = {"provider": None, "model": None, "temperature": None}
@@ -82,11 +833,11 @@ class DraftGenerationPipeline:
                 self._configure_gateway()
             except Exception as exc:
                 logger.error("LLM initialization failed: %s (type: %s)", str(exc), type(exc).__name__)
-                import traceback
-
                 logger.error("Full traceback: %s", traceback.format_exc())
 
-        self.link_repository = InternalLinkRepository()
+        # Optional override; by default propose_links resolves the process-wide repository
+        # per call so long-lived pipelines pick up a client that recovered after a failure.
+        self.link_repository: Optional[InternalLinkRepository] = None
 
     def _default_model_for_provider(self, provider: str) -> str:
         if provider == "anthropic" and self.settings.anthropic_model:
@@ -114,12 +865,11 @@ class DraftGenerationPipeline:
             raise RuntimeError("LLM gateway implementation unavailable")
 
         logger.info("Configuring LLM gateway provider=%s model=%s temperature=%.2f", provider, model, temperature)
-        self.ai_gateway = OpenAIGateway(
-            api_key=self.settings.openai_api_key,
-            model=model,
-            search_enabled=True,
-            provider=provider,
-            anthropic_api_key=self.settings.anthropic_api_key,
+        self.ai_gateway = _get_gateway(
+            provider,
+            model,
+            self.settings.openai_api_key,
+            self.settings.anthropic_api_key,
         )
         self._active_llm = {"provider": provider, "model": model, "temperature": temperature}
         if self.style_rewriter:
@@ -156,9 +906,9 @@ class DraftGenerationPipeline:
             raw_points = entry.get("key_points") or entry.get("topics") or []
             key_points: List[str] = []
             if isinstance(raw_points, str):
-                key_points = [item.strip() for item in re.split(r"[,、，\n]+", raw_points) if item.strip()]
+                key_points = _clean_strs(_KEY_POINT_SPLIT_RE.split(raw_points))
             elif isinstance(raw_points, list):
-                key_points = [str(item).strip() for item in raw_points if str(item).strip()]
+                key_points = _clean_strs(raw_points)
             else:
                 key_points = []
             if url and "example.com" in url:
@@ -177,49 +927,39 @@ class DraftGenerationPipeline:
         primary_keyword: str,
         min_topics: int = 3,
     ) -> List[str]:
-        from collections import Counter
-
-        counter: Counter[str] = Counter()
-        for result in serp_snapshot:
-            for point in result.get("key_points", []):
-                normalized = point.strip()
-                if normalized:
-                    counter[normalized] += 1
+        counter: Counter[str] = Counter(
+            normalized
+            for result in serp_snapshot
+            for point in result.get("key_points", [])
+            if (normalized := point.strip())
+        )
 
         if not counter:
             return []
 
-        unique_candidates = [topic for topic, freq in counter.items() if freq <= 1]
-        unique_candidates.sort(key=lambda item: item.lower())
-
-        gaps: List[str] = []
-        for topic in unique_candidates:
-            if topic not in gaps:
-                gaps.append(topic)
-            if len(gaps) >= min_topics:
-                break
+        # Counter keys are already unique, so only the low-frequency slice needs ordering.
+        gaps = heapq.nsmallest(
+            min_topics,
+            (topic for topic, freq in counter.items() if freq <= 1),
+            key=str.lower,
+        )
 
         if len(gaps) < min_topics:
             # supplement with high-signal topics to ensure coverage
+            seen = set(gaps)
             for topic, _freq in counter.most_common():
-                if topic not in gaps:
+                if topic not in seen:
+                    seen.add(topic)
                     gaps.append(topic)
                 if len(gaps) >= min_topics:
                     break
 
-        # Ensure primary keyword variations are emphasised
+        # Ensure primary keyword variations are emphasised; no existing topic contains the
+        # keyword here, so the inserted label cannot duplicate one.
         if primary_keyword and all(primary_keyword not in topic for topic in gaps):
             gaps.insert(0, f"{primary_keyword} の差別化視点")
 
-        # Deduplicate while preserving order
-        seen = set()
-        ordered: List[str] = []
-        for topic in gaps:
-            if topic in seen:
-                continue
-            seen.add(topic)
-            ordered.append(topic)
-        return ordered[: max(min_topics, 5)]
+        return gaps[: max(min_topics, 5)]
 
     def estimate_intent(self, payload: Dict) -> str:
         requested_intent = payload.get("intent")
@@ -244,6 +984,11 @@ class DraftGenerationPipeline:
         *,
         conclusion: Optional[Dict[str, Any]] = None,
     ) -> Dict:
+        outline = self._draft_outline(context, prompt)
+        return self._finish_outline(outline, context, conclusion)
+
+    def _draft_outline(self, context: PipelineContext, prompt: Dict) -> Dict:
+        """Build the conclusion-independent outline skeleton."""
         logger.info(
             "Generating outline for %s using prompt %s (mode=%s)",
             context.job_id,
@@ -259,19 +1004,38 @@ class DraftGenerationPipeline:
             outline["reader_note"] = reader_note
         if "provisional_title" not in outline and outline.get("title"):
             outline["provisional_title"] = outline["title"]
+        return outline
+
+    def _finish_outline(
+        self,
+        outline: Dict,
+        context: PipelineContext,
+        conclusion: Optional[Dict[str, Any]],
+    ) -> Dict:
         if conclusion:
             self._apply_conclusion_to_outline(outline, context, conclusion)
-        outline = self._annotate_outline_with_site_context(outline, context)
-        return outline
+        return self._annotate_outline_with_site_context(outline, context)
 
     def _build_quest_title(self, primary_keyword: str, context: Optional[PipelineContext] = None) -> str:
+        return self._quest_title_for(
+            primary_keyword,
+            context.article_type if context else "information",
+            context.expertise_level if context else "intermediate",
+            context.keyword_preset if context else None,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _quest_title_for(
+        primary_keyword: str,
+        article_type: str,
+        expertise: str,
+        keyword_preset: Optional[str],
+    ) -> str:
         keyword = primary_keyword or "SEO"
-        keyword_surface = self._sanitize_keyword_surface(keyword)
-        article_type = context.article_type if context else "information"
-        expertise = context.expertise_level if context else "intermediate"
-        is_glossary = (
-            (context and context.keyword_preset == "glossary")
-            or self._is_glossary_keyword(primary_keyword, article_type)
+        keyword_surface = DraftGenerationPipeline._sanitize_keyword_surface(keyword)
+        is_glossary = keyword_preset == "glossary" or DraftGenerationPipeline._is_glossary_keyword(
+            primary_keyword, article_type
         )
         glossary_phrase = f"{keyword_surface}とは" if is_glossary else keyword_surface
 
@@ -298,8 +1062,6 @@ class DraftGenerationPipeline:
         success_keys: Optional[List[str]] = None,
     ) -> str:
         """Build a concise H2 heading for the conclusion section."""
-        import re
-
         if success_keys:
             count = min(len(success_keys), 3)
             if count >= 3:
@@ -337,17 +1099,9 @@ class DraftGenerationPipeline:
         if context.heading_mode != "manual":
             first_heading = str(sections[0].get("text") or "").strip()
             if "結論" not in first_heading and "まとめ" not in first_heading:
-                success_keys = [
-                    str(point).strip()
-                    for point in conclusion.get("success_keys", [])[:4]
-                    if str(point).strip()
-                ]
-                supporting_points = success_keys or [
-                    str(point).strip()
-                    for point in conclusion.get("supporting_points", [])[:3]
-                    if str(point).strip()
-                ]
-                first_section_words = sections[0].get("estimated_words") or 260
+                success_keys = _clean_strs(conclusion.get("success_keys", [])[:4])
+                supporting_points = success_keys or _clean_strs(conclusion.get("supporting_points", [])[:3])
+                first_section_words = sections[0].get("estimated_words") or _CONCLUSION_SECTION_WORDS
                 keyword_surface = self._sanitize_keyword_surface(context.primary_keyword)
                 heading_text = self._shorten_conclusion_heading(
                     main_conclusion,
@@ -375,13 +1129,15 @@ class DraftGenerationPipeline:
             sections[0].setdefault("summary_hint", main_conclusion)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _sanitize_keyword_surface(keyword: str) -> str:
+        # Every stage of a job asks for the same primary keyword's surface form.
         raw_value = str(keyword or "").replace("\u3000", " ").strip()
         if not raw_value:
             return "SEO"
-        cleaned = re.sub(r"(?:\s|　)*(?:とは)+(?:[?？]*)$", "", raw_value).strip()
+        cleaned = _TOHA_SUFFIX_RE.sub("", raw_value).strip()
         if not cleaned:
-            fallback = re.sub(r"(?:とは|[?？])+", "", raw_value).strip()
+            fallback = _TOHA_ANY_RE.sub("", raw_value).strip()
             return fallback or "SEO"
         return cleaned
 
@@ -391,7 +1147,7 @@ class DraftGenerationPipeline:
         if article_type != "information":
             return False
         normalized = str(keyword or "").strip()
-        return bool(re.search(r"とは[?？]*$", normalized))
+        return bool(_GLOSSARY_SUFFIX_RE.search(normalized))
 
     def _infer_keyword_preset(self, primary_keyword: str, article_type: str) -> Optional[str]:
         """Return a preset label based on keyword form."""
@@ -429,11 +1185,12 @@ class DraftGenerationPipeline:
     def _extract_title_line(raw_text: str) -> str:
         if not raw_text:
             return ""
-        for line in raw_text.splitlines():
-            cleaned = line.strip()
+        # Scan lines lazily; only the first non-empty one is usually needed.
+        for match in _LINE_RE.finditer(raw_text):
+            cleaned = match.group().strip()
             if not cleaned:
                 continue
-            if cleaned.lower().startswith("title:"):
+            if cleaned[:6].lower() == "title:":
                 cleaned = cleaned.split(":", 1)[1].strip()
             cleaned = cleaned.strip("「」\"'“”")
             if cleaned:
@@ -446,7 +1203,7 @@ class DraftGenerationPipeline:
             return ""
         text = raw_text.strip()
         if text.startswith("```"):
-            text = re.sub(r"^```(?:json)?", "", text, flags=re.IGNORECASE).strip()
+            text = _JSON_FENCE_OPEN_RE.sub("", text).strip()
             if text.endswith("```"):
                 text = text[: -3].strip()
         return text
@@ -457,6 +1214,24 @@ class DraftGenerationPipeline:
             persona["expertise_level"] = context.expertise_level
 
         persona_label = infer_japanese_persona_label(persona, context.writer_persona)
+        first_goal = next((text for text in (str(goal).strip() for goal in persona.get("goals", [])) if text), "")
+        return self._reader_note_for(
+            persona_label,
+            context.expertise_level,
+            str(persona.get("reading_level") or ""),
+            first_goal,
+            str(persona.get("job_to_be_done") or "").strip(),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _reader_note_for(
+        persona_label: str,
+        expertise_level: str,
+        reading_level: str,
+        first_goal: str,
+        job_to_be_done: str,
+    ) -> str:
         intro_clause = build_intro_persona_clause(persona_label)
 
         fallback_levels = {
@@ -464,13 +1239,9 @@ class DraftGenerationPipeline:
             "intermediate": "施策を体系立てて比較検討したい層",
             "expert": "戦略と実行を同時に見直したい層",
         }
-        level_hint = persona.get("reading_level") or fallback_levels.get(
-            context.expertise_level, "実務で成果を出したい層"
-        )
-        goals = [str(goal).strip() for goal in persona.get("goals", []) if str(goal).strip()]
-        job_to_be_done = str(persona.get("job_to_be_done") or "").strip()
-        if goals:
-            detail_clause = f"特に「{goals[0]}」ための考え方と手順を整理しました。"
+        level_hint = reading_level or fallback_levels.get(expertise_level, "実務で成果を出したい層")
+        if first_goal:
+            detail_clause = f"特に「{first_goal}」ための考え方と手順を整理しました。"
         elif job_to_be_done:
             detail_clause = f"「{job_to_be_done}」を実現するまでのステップをわかりやすくまとめています。"
         else:
@@ -481,6 +1252,7 @@ class DraftGenerationPipeline:
     def _outline_from_manual(self, context: PipelineContext, prompt: Dict) -> Dict:
         sections = []
         budget = self._estimate_section_word_budget(context, len(context.heading_overrides) or 1)
+        goal_parts = self._section_goal_parts(context)
         for heading in context.heading_overrides:
             sections.append(
                 {
@@ -488,7 +1260,7 @@ class DraftGenerationPipeline:
                     "level": "h2",
                     "text": heading,
                     "purpose": "Custom",
-                    "section_goal": self._derive_section_goal(heading, context),
+                    "section_goal": self._format_section_goal(heading, *goal_parts),
                     "estimated_words": budget,
                     "h3": [],
                 }
@@ -510,14 +1282,12 @@ class DraftGenerationPipeline:
             target_reader_level=self._target_reader_level_from_expertise(context.expertise_level),
         )
         budget = self._estimate_section_word_budget(context, len(template_sections) or 1)
-        for idx, section in enumerate(template_sections):
-            section.setdefault("id", f"sec{idx+1}")
-            section.setdefault("level", "h2")
-            section.setdefault("section_goal", self._derive_section_goal(section.get("text") or section.get("heading") or "", context))
         for section in template_sections:
             section.setdefault("estimated_words", budget)
-            for h3 in section.get("h3", []):
-                h3.setdefault("estimated_words", max(int(budget / max(len(section.get("h3", [])) or 1, 1)), 120))
+            h3_list = section.get("h3") or ()
+            per_h3_budget = max(budget // (len(h3_list) or 1), _MIN_H3_WORD_BUDGET)
+            for h3 in h3_list:
+                h3.setdefault("estimated_words", per_h3_budget)
         max_gap_topics = 2 if context.keyword_preset == "glossary" else 5
         for gap_topic in context.serp_gap_topics[:max_gap_topics]:
             template_sections.append(
@@ -532,10 +1302,13 @@ class DraftGenerationPipeline:
                 }
             )
         # Re-assign IDs/section_goal after appending gap topics
+        goal_parts = self._section_goal_parts(context)
         for idx, section in enumerate(template_sections):
             section["id"] = f"sec{idx+1}"
             section["level"] = "h2"
-            section["section_goal"] = self._derive_section_goal(section.get("text") or section.get("heading") or "", context)
+            section["section_goal"] = self._format_section_goal(
+                section.get("text") or section.get("heading") or "", *goal_parts
+            )
         quest_title = self._build_quest_title(keyword, context)
         return {
             "title": quest_title,
@@ -552,457 +1325,26 @@ class DraftGenerationPipeline:
         *,
         target_reader_level: str = "middle",
     ) -> List[Dict[str, Any]]:
-        # Beginner-friendly templates (optimized for "◯◯とは" search intent)
-        keyword_surface = self._sanitize_keyword_surface(keyword)
-        def _default_role_tags(purpose: str) -> List[str]:
-            mapping = {
-                "Lead": ["QUEST:Q", "JOURNEY:認知"],
-                "Definition": ["QUEST:S", "JOURNEY:認知"],
-                "Context": ["QUEST:U", "JOURNEY:検討"],
-                "Channels": ["QUEST:S", "JOURNEY:検討", "VAK:V"],
-                "KPI": ["QUEST:S", "JOURNEY:検討", "VAK:K"],
-                "Risk": ["QUEST:E", "JOURNEY:比較"],
-                "Close": ["QUEST:T", "JOURNEY:意思決定", "VAK:A"],
-                "Gap": ["QUEST:E", "JOURNEY:検討"],
-            }
-            return mapping.get(purpose, [])
-
-        def _recommended_visuals(purpose: str) -> List[str]:
-            visuals = {
-                "Lead": ["ファネル図"],
-                "Definition": ["概念図"],
-                "Context": ["時系列チャート"],
-                "Channels": ["チャネル比較表"],
-                "KPI": ["KPIツリー"],
-                "Risk": ["注意点箇条書き"],
-                "Close": ["チェックリスト"],
-                "Gap": ["補完トピックの比較表"],
-            }
-            return visuals.get(purpose, [])
-
-        beginner_information_template = [
-            {
-                "text": f"{keyword_surface}とは何か？今さら聞けない基礎を整理する",
-                "purpose": "Lead",
-                "role_tags": _default_role_tags("Lead"),
-                "target_reader_level": target_reader_level,
-                "recommended_visuals": _recommended_visuals("Lead"),
-                "h3": [
-                    {"text": "いま抱えている悩みと、放置すると起きること", "purpose": "LeadQuest", "role_tags": ["QUEST:Q", "JOURNEY:認知"]},
-                    {"text": f"{keyword_surface}で得られる価値とこの記事の流れ", "purpose": "LeadQuest", "role_tags": ["QUEST:S", "JOURNEY:認知"]},
-                    {"text": "読み終えたあとに実践できる一歩", "purpose": "LeadQuest", "role_tags": ["QUEST:T", "JOURNEY:意思決定"]},
-                ],
-            },
-            {
-                "text": f"{keyword_surface}とは何か（定義と従来マーケとの違い）",
-                "purpose": "Definition",
-                "role_tags": _default_role_tags("Definition"),
-                "target_reader_level": target_reader_level,
-                "recommended_visuals": _recommended_visuals("Definition"),
-                "h3": [
-                    {"text": f"{keyword_surface}の定義を一文で明示", "purpose": "Definition", "role_tags": ["QUEST:S"]},
-                    {"text": "従来マーケとの違いと役割分担", "purpose": "Difference", "role_tags": ["JOURNEY:認知"]},
-                    {"text": "向いているケース・向かないケース", "purpose": "FitUnfit", "role_tags": ["JOURNEY:比較"]},
-                ],
-            },
-            {
-                "text": f"いま{keyword_surface}が重要になっている背景",
-                "purpose": "Context",
-                "role_tags": _default_role_tags("Context"),
-                "target_reader_level": target_reader_level,
-                "recommended_visuals": _recommended_visuals("Context"),
-                "h3": [
-                    {"text": "市場環境や顧客行動の変化", "purpose": "MarketShift", "role_tags": ["QUEST:U", "JOURNEY:認知"]},
-                    {"text": "法規制・技術トレンド（Cookie/個人情報保護など）", "purpose": "Regulation", "role_tags": ["QUEST:U"]},
-                    {"text": "オフライン施策との役割分担", "purpose": "OfflineRole", "role_tags": ["JOURNEY:検討"]},
-                ],
-            },
-            {
-                "text": "主な施策・チャネルの種類と役割",
-                "purpose": "Channels",
-                "role_tags": _default_role_tags("Channels"),
-                "target_reader_level": target_reader_level,
-                "recommended_visuals": _recommended_visuals("Channels"),
-                "h3": [
-                    {"text": "自社サイト/SEO/コンテンツマーケの基礎", "purpose": "OwnedSeo", "role_tags": ["VAK:V"]},
-                    {"text": "広告・SNSでの集客と向き不向き", "purpose": "AdsSNS", "role_tags": ["JOURNEY:認知"]},
-                    {"text": "メール/MA/ウェビナーなど育成施策", "purpose": "Nurture", "role_tags": ["JOURNEY:検討"]},
-                ],
-            },
-            {
-                "text": "成功させるためのポイント・KPI設計",
-                "purpose": "KPI",
-                "role_tags": _default_role_tags("KPI"),
-                "target_reader_level": target_reader_level,
-                "recommended_visuals": _recommended_visuals("KPI"),
-                "h3": [
-                    {"text": "ファネル別のKPIと計測の考え方", "purpose": "FunnelKPI", "role_tags": ["VAK:K"]},
-                    {"text": "組織・体制づくりとリソース配分", "purpose": "Org", "role_tags": ["JOURNEY:検討"]},
-                    {"text": "ツール活用は代表例のみ挙げ、設定手順は避ける", "purpose": "ToolsLight", "role_tags": ["VAK:K"]},
-                ],
-            },
-            {
-                "text": "よくある失敗パターンと対策",
-                "purpose": "Risk",
-                "role_tags": _default_role_tags("Risk"),
-                "target_reader_level": target_reader_level,
-                "recommended_visuals": _recommended_visuals("Risk"),
-                "h3": [
-                    {"text": "チャネルごとの部分最適・計測偏重になりがち", "purpose": "ChannelSilod", "role_tags": ["QUEST:E"]},
-                    {"text": "ターゲット/メッセージのずれ", "purpose": "MessageMismatch", "role_tags": ["QUEST:E"]},
-                    {"text": "短期で判断しすぎる/データの読み違い", "purpose": "ShortTerm", "role_tags": ["QUEST:E"]},
-                ],
-            },
-            {
-                "text": f"まとめと今日から取れる一歩（{keyword_surface}の活かし方）",
-                "purpose": "Close",
-                "role_tags": _default_role_tags("Close"),
-                "target_reader_level": target_reader_level,
-                "recommended_visuals": _recommended_visuals("Close"),
-                "h3": [
-                    {"text": "主要ポイントの振り返り", "purpose": "Recap", "role_tags": ["QUEST:T"]},
-                    {"text": "すぐに試せる1アクションとCTA", "purpose": "Action", "role_tags": ["QUEST:T", "JOURNEY:意思決定"]},
-                ],
-            },
-        ]
-
-        glossary_information_template = beginner_information_template
-        beginner_comparison_template = [
-            {
-                "text": "30秒で要点：この記事で分かること",
-                "purpose": "Summary",
-                "h3": [
-                    {"text": "おすすめTOP3の結論", "purpose": "Summary"},
-                    {"text": "選び方の基準", "purpose": "Quick"},
-                ],
-            },
-            {
-                "text": f"{keyword_surface}を選ぶポイントを3軸で解説",
-                "purpose": "Introduction",
-                "h3": [
-                    {"text": "何を基準に選べばいい？", "purpose": "Criteria"},
-                    {"text": "初心者が気をつけるべきこと", "purpose": "Caution"},
-                ],
-            },
-            {
-                "text": "おすすめTOP3の比較",
-                "purpose": "Comparison",
-                "h3": [
-                    {"text": "1位：これが一番おすすめの理由", "purpose": "Top1"},
-                    {"text": "2位・3位：他の選択肢", "purpose": "Top23"},
-                ],
-            },
-            {
-                "text": "使う人別のおすすめ",
-                "purpose": "Segmentation",
-                "h3": [
-                    {"text": "初めて使う人向け", "purpose": "Beginner"},
-                    {"text": "予算を抑えたい人向け", "purpose": "Budget"},
-                ],
-            },
-            {
-                "text": f"まとめ：{keyword_surface}を始めてみよう",
-                "purpose": "Close",
-                "h3": [
-                    {"text": "次にやってみること", "purpose": "NextAction"},
-                ],
-            },
-        ]
-
-        beginner_ranking_template = [
-            {
-                "text": "30秒で要点：ランキング結果",
-                "purpose": "Summary",
-                "h3": [
-                    {"text": "TOP3のハイライト", "purpose": "Highlight"},
-                    {"text": "どうやってランク付けしたの？", "purpose": "Method"},
-                ],
-            },
-            {
-                "text": "1位から3位を詳しく紹介",
-                "purpose": "Review",
-                "h3": [
-                    {"text": "第1位：おすすめポイントと特徴", "purpose": "Rank1"},
-                    {"text": "第2位・第3位の良いところ", "purpose": "Rank23"},
-                ],
-            },
-            {
-                "text": "あなたに合うのはどれ？",
-                "purpose": "Segmentation",
-                "h3": [
-                    {"text": "こんな人には1位がおすすめ", "purpose": "Type1"},
-                    {"text": "こんな人には2位・3位がおすすめ", "purpose": "Type23"},
-                ],
-            },
-            {
-                "text": "よくある失敗と対策",
-                "purpose": "Risk",
-                "h3": [
-                    {"text": "初心者がつまずきやすいポイント", "purpose": "Mistakes"},
-                    {"text": "お得に始める方法", "purpose": "Deals"},
-                ],
-            },
-            {
-                "text": "まとめと次のステップ",
-                "purpose": "Close",
-                "h3": [
-                    {"text": "次にやってみること", "purpose": "NextAction"},
-                ],
-            },
-        ]
-
-        # Intermediate/Expert templates (existing)
-        information_template = [
-            {
-                "text": f"結論: {keyword_surface}で実現できる成果と次のアクション",
-                "purpose": "Summary",
-                "h3": [
-                    {"text": "最優先で押さえるべき成功条件", "purpose": "Summary"},
-                    {"text": "効果検証に用いる主要指標", "purpose": "Summary"},
-                ],
-            },
-            {
-                "text": "背景と課題: なぜいま取り組む必要があるのか",
-                "purpose": "Context",
-                "h3": [
-                    {"text": "読者が直面する具体的な課題シナリオ", "purpose": "Context"},
-                    {"text": "関連する市場動向・法規制", "purpose": "Context"},
-                ],
-            },
-            {
-                "text": "根拠と仕組み: 成果を支えるメカニズム",
-                "purpose": "Mechanism",
-                "h3": [
-                    {"text": "一次情報・統計で裏付ける効果", "purpose": "Mechanism"},
-                    {"text": "仕組み・プロセスの分解と要点", "purpose": "Mechanism"},
-                ],
-            },
-            {
-                "text": "実践ステップ: 再現性のある進め方",
-                "purpose": "Execution",
-                "h3": [
-                    {"text": "着手前に整える前提条件", "purpose": "Execution"},
-                    {"text": "ステップごとのタスクと注意点", "purpose": "Execution"},
-                ],
-            },
-            {
-                "text": "事例と比較: 選択肢ごとの成果と向き・不向き",
-                "purpose": "Case",
-                "h3": [
-                    {"text": "成功事例で確認できた定量的成果", "purpose": "Case"},
-                    {"text": "他手法との違いと併用パターン", "purpose": "Case"},
-                ],
-            },
-            {
-                "text": "リスクと対策: つまずきポイントの予防策",
-                "purpose": "Risk",
-                "h3": [
-                    {"text": "よくある失敗パターンと兆候", "purpose": "Risk"},
-                    {"text": "リカバリーと継続改善のチェックリスト", "purpose": "Risk"},
-                ],
-            },
-            {
-                "text": "まとめと次のステップ",
-                "purpose": "Close",
-                "h3": [
-                    {"text": "本記事で押さえた主要論点の整理", "purpose": "Close"},
-                    {"text": "今後の検討で確認すべき追加情報", "purpose": "Close"},
-                ],
-            },
-        ]
-
-        comparison_template = [
-            {
-                "text": f"結論: {keyword}のおすすめと評価サマリー",
-                "purpose": "Summary",
-                "h3": [
-                    {"text": "最優先で検討すべき候補と理由", "purpose": "Summary"},
-                    {"text": "評価に用いた基準の概要", "purpose": "Summary"},
-                ],
-            },
-            {
-                "text": "評価軸と選定基準",
-                "purpose": "Criteria",
-                "h3": [
-                    {"text": "比較項目（機能・価格・サポート等）", "purpose": "Criteria"},
-                    {"text": "用途別に優先すべき指標", "purpose": "Criteria"},
-                ],
-            },
-            {
-                "text": "主要候補の比較表と要点",
-                "purpose": "Comparison",
-                "h3": [
-                    {"text": "TOP3製品の特徴と向いているケース", "purpose": "Comparison"},
-                    {"text": "定量データで見る強み・弱み", "purpose": "Comparison"},
-                ],
-            },
-            {
-                "text": "用途別・規模別の向き不向き",
-                "purpose": "Segmentation",
-                "h3": [
-                    {"text": "小規模チーム／初導入でのポイント", "purpose": "Segmentation"},
-                    {"text": "エンタープライズ・高機能ニーズの場合", "purpose": "Segmentation"},
-                ],
-            },
-            {
-                "text": "価格・導入難易度・サポート体制",
-                "purpose": "Operations",
-                "h3": [
-                    {"text": "料金体系と総コストの比較", "purpose": "Operations"},
-                    {"text": "導入期間・必要リソース・サポート", "purpose": "Operations"},
-                ],
-            },
-            {
-                "text": "検討時の注意点と確認項目",
-                "purpose": "Risk",
-                "h3": [
-                    {"text": "想定されるリスクとチェックリスト", "purpose": "Risk"},
-                    {"text": "契約前に確認すべき一次情報", "purpose": "Risk"},
-                ],
-            },
-            {
-                "text": "まとめと調達に向けた次アクション",
-                "purpose": "Close",
-                "h3": [
-                    {"text": "意思決定を進めるための準備物", "purpose": "Close"},
-                    {"text": "出典・比較データの参照先", "purpose": "Close"},
-                ],
-            },
-        ]
-
-        ranking_template = [
-            {
-                "text": f"結論: {keyword}ランキングのハイライト",
-                "purpose": "Summary",
-                "h3": [
-                    {"text": "評価方法とTOP3の総評", "purpose": "Summary"},
-                    {"text": "読者タイプ別のおすすめ候補", "purpose": "Summary"},
-                ],
-            },
-            {
-                "text": "ランクインの評価軸とスコア",
-                "purpose": "Criteria",
-                "h3": [
-                    {"text": "主要指標と計測方法", "purpose": "Criteria"},
-                    {"text": "データソースと出典", "purpose": "Criteria"},
-                ],
-            },
-            {
-                "text": "TOP3の詳細レビュー",
-                "purpose": "Review",
-                "h3": [
-                    {"text": "第1位の概要と導入メリット", "purpose": "Review"},
-                    {"text": "第2位・第3位の特徴と適合シーン", "purpose": "Review"},
-                ],
-            },
-            {
-                "text": "用途別・業界別のおすすめ",
-                "purpose": "Segmentation",
-                "h3": [
-                    {"text": "コスト重視の選択肢", "purpose": "Segmentation"},
-                    {"text": "機能・サポート重視の選択肢", "purpose": "Segmentation"},
-                ],
-            },
-            {
-                "text": "導入時の注意点とチェックリスト",
-                "purpose": "Risk",
-                "h3": [
-                    {"text": "よくある失敗ポイント", "purpose": "Risk"},
-                    {"text": "契約・運用で確認したい事項", "purpose": "Risk"},
-                ],
-            },
-            {
-                "text": "資料・比較表と次アクション",
-                "purpose": "Close",
-                "h3": [
-                    {"text": "ダウンロード資料・出典リンク", "purpose": "Close"},
-                    {"text": "社内で検討を進める際のTips", "purpose": "Close"},
-                ],
-            },
-        ]
-
-        closing_template = [
-            {
-                "text": f"結論: {keyword}導入で得られる成果の再確認",
-                "purpose": "Summary",
-                "h3": [
-                    {"text": "意思決定を後押しする定量的根拠", "purpose": "Summary"},
-                    {"text": "導入後のロードマップ概要", "purpose": "Summary"},
-                ],
-            },
-            {
-                "text": "導入プロセスと成功条件",
-                "purpose": "Execution",
-                "h3": [
-                    {"text": "短期導入ステップと役割分担", "purpose": "Execution"},
-                    {"text": "成功事例から学ぶ運用ポイント", "purpose": "Execution"},
-                ],
-            },
-            {
-                "text": "ROIとリスクコントロール",
-                "purpose": "Finance",
-                "h3": [
-                    {"text": "投資対効果を示す数値・試算", "purpose": "Finance"},
-                    {"text": "リスクとコンプライアンス対応", "purpose": "Finance"},
-                ],
-            },
-            {
-                "text": "クロージング: 契約・導入に向けた次アクション",
-                "purpose": "Close",
-                "h3": [
-                    {"text": "比較検討の最終チェックリスト", "purpose": "Close"},
-                    {"text": "社内稟議資料で押さえるべき要素", "purpose": "Close"},
-                ],
-            },
-        ]
-
-        # Select templates based on expertise level
-        information_template_to_use = beginner_information_template
-        if expertise_level == "beginner":
-            information_template_to_use = glossary_information_template if keyword_preset == "glossary" else beginner_information_template
-            templates = {
-                "information": information_template_to_use,
-                "comparison": beginner_comparison_template,
-                "ranking": beginner_ranking_template,
-                "closing": beginner_information_template,  # Use information template for closing
-            }
-        else:
-            # intermediate and expert use the same structure templates
-            templates = {
-                "information": information_template,
-                "comparison": comparison_template,
-                "ranking": ranking_template,
-                "closing": closing_template,
-            }
-            information_template_to_use = information_template
-        default_information_template = (
-            information_template if expertise_level != "beginner" else information_template_to_use
-        )
-
-        resolved = []
-        for section in templates.get(article_type, default_information_template):
-            resolved.append(
-                {
-                    "id": f"sec{len(resolved)+1}",
-                    "level": "h2",
-                    "text": section["text"],
-                    "purpose": section.get("purpose", "Know"),
-                    "section_goal": section.get("section_goal"),
-                    "h3": [dict(item) for item in section.get("h3", [])],
-                }
-            )
-        return resolved
+        # The glossary preset shares the beginner information skeleton, and the reader level
+        # never reaches the emitted sections, so neither changes which spec is used.
+        tier = "beginner" if expertise_level == "beginner" else "default"
+        if article_type not in _TEMPLATE_SPECS[tier]:
+            article_type = "information"
+        spec = _render_template_spec(tier, article_type, keyword, self._sanitize_keyword_surface(keyword))
+        return _materialize_template(spec)
 
     def _estimate_section_word_budget(self, context: PipelineContext, section_count: int) -> int:
         if not context.word_count_range:
             return 300
-        numbers = [int(num) for num in re.findall(r"\d+", context.word_count_range)]
-        if not numbers:
-            return 300
-        average = sum(numbers) / len(numbers)
-        return max(int(average / max(section_count, 1)), 200)
+        return _section_word_budget(context.word_count_range, section_count)
 
-    def generate_draft(self, context: PipelineContext, outline: Dict, citations: List[Dict]) -> Dict:
+    def generate_draft(
+        self,
+        context: PipelineContext,
+        outline: Dict,
+        citations: List[Dict],
+        faq_future: Optional[Future] = None,
+    ) -> Dict:
         logger.info(
             "Generating draft for %s with %d outline sections (max_workers=%d)",
             context.job_id,
@@ -1011,29 +1353,33 @@ class DraftGenerationPipeline:
         )
         sections: List[Dict[str, Any]] = []
         all_claims: List[Dict[str, Any]] = []
-
-        def build_paragraph(heading_text: str, level: str, section_goal: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-            messages = self._build_prompt_messages(heading_text, level, context, section_goal=section_goal)
-            grounded_result = self._generate_grounded_content(
-                messages=messages,
-                temperature=context.llm_temperature,
-                log_info={
-                    "stage": "generate_draft",
-                    "heading": heading_text,
-                    "level": level,
-                    "job_id": context.job_id,
-                    "draft_id": context.draft_id,
-                },
-            )
-            claim_id = f"{context.draft_id}-{heading_text}"
+        # Fallback sources are identical for every paragraph, so resolve them once per draft.
+        fallback_sources = citations[:2] or [{"url": url} for url in context.reference_urls[:2]]
+        static = self._precompute_prompt_static(context)
+        source_matcher = self._compile_source_matcher(context.preferred_sources)
+        # The fallback ordering is the same for every paragraph, so rank it once up front.
+        fallback_citation_values = [
+            c.get("uri") or c.get("url") or str(c)
+            for c in self._prioritize_sources(fallback_sources, context.preferred_sources, source_matcher)
+        ]
+        # FAQ answers only depend on the context, so generate them alongside the sections
+        # unless the caller already started them.
+        if faq_future is None:
+            faq_future = _shared_executor().submit(self._generate_faq, context)
+
+        def assemble_paragraph(
+            heading_text: str, level: str, grounded_result: Dict[str, Any], raw_text: Any
+        ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            claim_key = f"{context.draft_id}:{heading_text}"
             if level == "h2":
-                claim_id = f"{context.draft_id}-{level}-{heading_text}"
-            source_candidates = grounded_result.get("citations") or citations[:2]
-            if not source_candidates and context.reference_urls:
-                source_candidates = [{"url": url} for url in context.reference_urls[:2]]
-            prioritized_sources = self._prioritize_sources(source_candidates, context.preferred_sources)
-            citation_values = [c.get("uri") or c.get("url") or str(c) for c in prioritized_sources]
-            raw_text = grounded_result.get("text")
+                claim_key = f"{context.draft_id}:{level}:{heading_text}"
+            claim_id = str(uuid.uuid5(_CLAIM_ID_NAMESPACE, claim_key))
+            grounded_citations = grounded_result.get("citations")
+            if grounded_citations:
+                prioritized_sources = self._prioritize_sources(grounded_citations, context.preferred_sources, source_matcher)
+                citation_values = [c.get("uri") or c.get("url") or str(c) for c in prioritized_sources]
+            else:
+                citation_values = list(fallback_citation_values)
             normalized_text = raw_text.strip() if isinstance(raw_text, str) else ""
             paragraph_text = normalized_text or f"{heading_text} について解説します。"
             paragraph_text = self._strip_leading_heading(paragraph_text, heading_text)
@@ -1052,54 +1398,146 @@ class DraftGenerationPipeline:
             }
             return paragraph_payload, claim_payload
 
+        def build_paragraph(heading_text: str, level: str, section_goal: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            messages = self._build_prompt_messages(heading_text, level, context, section_goal=section_goal, static=static)
+            grounded_result = self._generate_grounded_content(
+                messages=messages,
+                temperature=context.llm_temperature,
+                log_info={
+                    "stage": "generate_draft",
+                    "heading": heading_text,
+                    "level": level,
+                    "job_id": context.job_id,
+                    "draft_id": context.draft_id,
+                },
+            )
+            return assemble_paragraph(heading_text, level, grounded_result, grounded_result.get("text"))
+
+        def build_section(
+            h2_text: str, h3_headings: List[str], section_goal: Optional[str]
+        ) -> Optional[List[Tuple[Dict[str, Any], Dict[str, Any]]]]:
+            # One request covers every H3 of the section so the shared prompt layers are sent once.
+            # None asks the caller to fall back to per-H3 calls.
+            messages = self._build_section_batch_messages(h2_text, h3_headings, context, section_goal, static)
+            grounded_result = self._generate_grounded_content(
+                messages=messages,
+                temperature=context.llm_temperature,
+                log_info={
+                    "stage": "generate_draft_batch",
+                    "heading": h2_text,
+                    "level": "h2",
+                    "job_id": context.job_id,
+                    "draft_id": context.draft_id,
+                },
+            )
+            texts = self._parse_section_batch(grounded_result.get("text"), len(h3_headings))
+            if texts is None:
+                logger.warning(
+                    "Batched section '%s' returned unusable JSON for job %s; falling back to per-H3 calls",
+                    h2_text,
+                    context.job_id,
+                )
+                return None
+            return [
+                assemble_paragraph(heading, "h3", grounded_result, text)
+                for heading, text in zip(h3_headings, texts)
+            ]
+
         outline_h2 = outline.get("h2", [])
         if not outline_h2:
             logger.warning("Outline missing h2 sections for %s", context.job_id)
 
+        batch_sections = bool(getattr(self.settings, "batch_h3_per_h2", False))
         future_map = {}
-        h2_paragraphs: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+        # Paragraph slots per H2 are known at submit time, so completions are written in place.
+        h2_paragraphs: Dict[int, List[Optional[Dict[str, Any]]]] = {}
         h2_claims: Dict[int, List[Dict[str, Any]]] = {}
+        # H3 headings and goal of each batched section, kept for the per-H3 fallback.
+        section_batches: Dict[int, Tuple[List[str], Optional[str]]] = {}
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            for h2_index, h2 in enumerate(outline_h2):
-                h3_list = h2.get("h3", [])
-                section_goal = h2.get("section_goal") or self._derive_section_goal(h2.get("text", "") or h2.get("heading", ""), context)
-                if h3_list:
-                    for h3_index, h3 in enumerate(h3_list):
-                        future = executor.submit(build_paragraph, h3["text"], "h3", section_goal)
-                        future_map[future] = (h2_index, h3_index)
-                else:
-                    future = executor.submit(build_paragraph, h2["text"], "h2", section_goal)
-                    future_map[future] = (h2_index, 0)
-
-            for future in as_completed(future_map):
+        jobs: List[Tuple[int, Tuple[int, Optional[int]], Any, Tuple[Any, ...]]] = []
+        for h2_index, h2 in enumerate(outline_h2):
+            h3_list = h2.get("h3", [])
+            section_goal = h2.get("section_goal") or self._derive_section_goal(
+                h2.get("text", "") or h2.get("heading", ""), context, static
+            )
+            h2_paragraphs[h2_index] = [None] * (len(h3_list) or 1)
+            if batch_sections and len(h3_list) > 1:
+                weight = sum(self._estimated_words(h3) for h3 in h3_list)
+                section_batches[h2_index] = ([h3["text"] for h3 in h3_list], section_goal)
+                jobs.append((weight, (h2_index, None), build_section, (h2["text"], *section_batches[h2_index])))
+            elif h3_list:
+                for h3_index, h3 in enumerate(h3_list):
+                    jobs.append((self._estimated_words(h3), (h2_index, h3_index), build_paragraph, (h3["text"], "h3", section_goal)))
+            else:
+                jobs.append((self._estimated_words(h2), (h2_index, 0), build_paragraph, (h2["text"], "h2", section_goal)))
+        # The pool already hands queued work to whichever thread frees up first; starting the
+        # longest generations first keeps one late, long paragraph from stretching the tail.
+        jobs.sort(key=lambda job: job[0], reverse=True)
+
+        # Paragraph fan-out shares the process-wide pool, so concurrent jobs stay under one bound.
+        # The pool also runs _generate_faq, which fans out and waits; that only avoids deadlock
+        # because _generate_grounded_batch runs unstarted requests inline on pool threads.
+        # Any new nested submit-and-wait on this pool needs the same treatment.
+        executor = _shared_executor()
+        for _weight, key, build, args in jobs:
+            future_map[executor.submit(build, *args)] = key
+
+        pending = set(future_map)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
                 h2_index, order = future_map[future]
-                try:
-                    paragraph, claim = future.result()
-                except Exception as exc:
-                    logger.exception(
-                        "Paragraph generation failed for job %s section %s: %s",
-                        context.job_id,
-                        h2_index,
-                        exc,
-                    )
-                    paragraph = {
-                        "heading": outline_h2[h2_index]["text"],
-                        "text": "生成に失敗しましたが、要点を後で補完してください。",
-                        "citations": [],
-                        "claim_id": f"{context.draft_id}-fallback-{h2_index}-{order}",
-                    }
-                    claim = {
-                        "id": paragraph["claim_id"],
-                        "text": paragraph["text"],
-                        "citations": [],
-                    }
-                h2_paragraphs.setdefault(h2_index, []).append((order, paragraph))
-                h2_claims.setdefault(h2_index, []).append(claim)
+                if order is None:
+                    try:
+                        batch_results = future.result()
+                    except Exception as exc:
+                        logger.exception(
+                            "Batched section generation failed for job %s section %s: %s",
+                            context.job_id,
+                            h2_index,
+                            exc,
+                        )
+                        batch_results = None
+                    if batch_results is None:
+                        # Same per-H3 fallback as the unbatched path, fanned out on the pool.
+                        h3_headings, batch_goal = section_batches[h2_index]
+                        for h3_index, heading in enumerate(h3_headings):
+                            fallback = executor.submit(build_paragraph, heading, "h3", batch_goal)
+                            future_map[fallback] = (h2_index, h3_index)
+                            pending.add(fallback)
+                        continue
+                    results = list(enumerate(batch_results))
+                else:
+                    try:
+                        results = [(order, future.result())]
+                    except Exception as exc:
+                        logger.exception(
+                            "Paragraph generation failed for job %s section %s: %s",
+                            context.job_id,
+                            h2_index,
+                            exc,
+                        )
+                        paragraph = {
+                            "heading": outline_h2[h2_index]["text"],
+                            "text": "生成に失敗しましたが、要点を後で補完してください。",
+                            "citations": [],
+                            "claim_id": str(
+                                uuid.uuid5(_CLAIM_ID_NAMESPACE, f"{context.draft_id}:fallback:{h2_index}:{order}")
+                            ),
+                        }
+                        claim = {
+                            "id": paragraph["claim_id"],
+                            "text": paragraph["text"],
+                            "citations": [],
+                        }
+                        results = [(order, (paragraph, claim))]
+                for position, (paragraph, claim) in results:
+                    h2_paragraphs[h2_index][position] = paragraph
+                    h2_claims.setdefault(h2_index, []).append(claim)
 
         for h2_index, h2 in enumerate(outline_h2):
-            paragraph_entries = sorted(h2_paragraphs.get(h2_index, []), key=lambda item: item[0])
-            paragraphs = [entry for _order, entry in paragraph_entries]
+            paragraphs = [paragraph for paragraph in h2_paragraphs[h2_index] if paragraph is not None]
             if not paragraphs:
                 logger.warning("No paragraphs generated for job %s section %s", context.job_id, h2["text"])
             sections.append({"h2": h2["text"], "paragraphs": paragraphs})
@@ -1107,20 +1545,60 @@ class DraftGenerationPipeline:
 
         return {
             "sections": sections,
-            "faq": self._generate_faq(context),
+            "faq": faq_future.result(),
             "claims": all_claims,
         }
 
-    def _build_prompt_messages(self, heading: str, level: str, context: PipelineContext, section_goal: Optional[str] = None) -> List[Dict[str, str]]:
-        """Build layered prompt messages (system/developer/user)."""
+    @staticmethod
+    def _estimated_words(item: Dict[str, Any]) -> int:
+        value = item.get("estimated_words")
+        return value if isinstance(value, int) else 0
+
+    def _build_section_batch_messages(
+        self,
+        h2_text: str,
+        h3_headings: Sequence[str],
+        context: PipelineContext,
+        section_goal: Optional[str],
+        static: PromptStatic,
+    ) -> List[Dict[str, str]]:
+        """Build one request for all H3s of a section, keeping the shared layers as the prefix."""
+        messages = self._build_prompt_messages(h2_text, "h2", context, section_goal=section_goal, static=static)
+        listing = "\n".join(f"{index}. {heading}" for index, heading in enumerate(h3_headings, 1))
+        instruction = _SECTION_BATCH_INSTRUCTION.format(count=len(h3_headings), headings=listing)
+        user_message = messages[-1]
+        messages[-1] = {**user_message, "content": "\n\n".join(filter(None, [user_message["content"], instruction]))}
+        return messages
+
+    @classmethod
+    def _parse_section_batch(cls, raw_text: Any, expected: int) -> Optional[List[str]]:
+        """Return one paragraph text per H3, or None when the batched reply cannot be trusted."""
+        if not isinstance(raw_text, str):
+            return None
+        try:
+            parsed = _loads_json(cls._strip_json_fence(raw_text))
+        except ValueError:
+            return None
+        items = parsed.get("paragraphs") if isinstance(parsed, dict) else parsed
+        if not isinstance(items, list) or len(items) != expected:
+            return None
+        texts: List[str] = []
+        for item in items:
+            text = item.get("text") if isinstance(item, dict) else None
+            if not isinstance(text, str) or not text.strip():
+                return None
+            texts.append(text)
+        return texts
+
+    def _precompute_prompt_static(self, context: PipelineContext) -> PromptStatic:
+        """Resolve persona, writer and reference strings once per draft."""
         # Select prompt layers based on expertise level and project defaults
         expertise_layers = get_prompt_layers_for_expertise(context.expertise_level)
 
         logger.info(
-            "Selecting prompt for expertise_level=%s, tone=%s, heading=%s",
+            "Selecting prompt for expertise_level=%s, tone=%s",
             context.expertise_level,
             context.tone,
-            heading
         )
 
         base_layers = context.prompt_layers if (context.prompt_layers and any(context.prompt_layers.values())) else {}
@@ -1133,14 +1611,9 @@ class DraftGenerationPipeline:
         prompt_layers = self._augment_layers_for_preset(prompt_layers, context)
 
         writer = context.writer_persona or {}
-        writer_name = writer.get("name") or "シニアSEOライター"
-        writer_role = writer.get("role") or "シニアSEO編集者"
-        writer_voice = writer.get("voice") or "落ち着いた敬体で簡潔に説明する"
-        writer_expertise = writer.get("expertise") or "SEOとB2Bマーケに精通"
-        writer_mission = writer.get("mission") or "読者の迷いを解き行動を後押しする"
         raw_qualities = writer.get("qualities") or []
         if isinstance(raw_qualities, list):
-            writer_qualities = " / ".join(str(item).strip() for item in raw_qualities if str(item).strip())
+            writer_qualities = " / ".join(_clean_strs(raw_qualities))
         elif isinstance(raw_qualities, str):
             writer_qualities = raw_qualities.strip()
         else:
@@ -1151,26 +1624,28 @@ class DraftGenerationPipeline:
         if "expertise_level" not in persona_payload:
             persona_payload["expertise_level"] = context.expertise_level
         persona_label = infer_japanese_persona_label(persona_payload, context.writer_persona)
-        persona_intro_clause = build_intro_persona_clause(persona_label)
 
-        reader_name = context.persona.get("name") or "読者"
         reader_tone = context.persona.get("tone") or "実務的"
+        mission = context.writer_persona.get("mission") if isinstance(context.writer_persona, dict) else None
 
-        references = ", ".join(context.reference_urls[:5]) if context.reference_urls else "指定なし"
-        preferred_sources = ", ".join(context.preferred_sources[:5]) if context.preferred_sources else "優先指定なし"
-        preferred_media = ", ".join(context.reference_media[:5]) if context.reference_media else "優先指定なし"
-        notation = context.notation_guidelines or "読みやすい日本語（全角を適切に使用）"
-        gap_topics = ", ".join(context.serp_gap_topics[:3]) if context.serp_gap_topics else "差別化指示なし"
-
+        writer_name = writer.get("name") or "シニアSEOライター"
+        writer_role = writer.get("role") or "シニアSEO編集者"
+        writer_voice = writer.get("voice") or "落ち着いた敬体で簡潔に説明する"
+        writer_expertise = writer.get("expertise") or "SEOとB2Bマーケに精通"
+        writer_mission = writer.get("mission") or "読者の迷いを解き行動を後押しする"
+        reader_name = context.persona.get("name") or "読者"
         reader_profile = self._render_reader_profile(context.persona, reader_tone)
-        section_goal = section_goal or self._derive_section_goal(heading, context)
+        references = ", ".join(islice(context.reference_urls, 5)) if context.reference_urls else "指定なし"
+        preferred_sources = ", ".join(islice(context.preferred_sources, 5)) if context.preferred_sources else "優先指定なし"
+        preferred_media = ", ".join(islice(context.reference_media, 5)) if context.reference_media else "優先指定なし"
+        gap_topics = ", ".join(islice(context.serp_gap_topics, 3)) if context.serp_gap_topics else "差別化指示なし"
+        notation = context.notation_guidelines or "読みやすい日本語（全角を適切に使用）"
+        persona_intro = build_intro_persona_clause(persona_label)
 
-        format_payload = {
+        base_payload = {
             "writer_name": writer_name,
             "reader_name": reader_name,
-            "heading": heading,
-            "level": level.upper(),
-            "primary_keyword": context.primary_keyword or heading,
+            "primary_keyword": context.primary_keyword,
             "reader_profile": reader_profile,
             "writer_role": writer_role,
             "writer_voice": writer_voice,
@@ -1184,21 +1659,65 @@ class DraftGenerationPipeline:
             "notation": notation,
             "article_type": context.article_type,
             "intent": context.intent,
-            "section_goal": section_goal,
             "gap_topics": gap_topics,
             "persona_label": persona_label,
-            "persona_intro": persona_intro_clause,
+            "persona_intro": persona_intro,
         }
+        # primary_keyword falls back to the heading, so it is per-heading only when unset.
+        heading_fields = _PER_HEADING_FIELDS if context.primary_keyword else _PER_HEADING_FIELDS | {"primary_keyword"}
 
-        system_template = prompt_layers.get("system", "")
-        developer_template = prompt_layers.get("developer", "")
-        user_template = prompt_layers.get("user", "")
+        return PromptStatic(
+            prompt_layers=prompt_layers,
+            reader_name=reader_name,
+            mission_clause=mission or "迷いを解いて行動を後押しする",
+            is_b2b=self._is_b2b_context(context),
+            base_payload=base_payload,
+            system_message=_prerender_layer(prompt_layers.get("system", ""), base_payload, heading_fields),
+            developer_message=_prerender_layer(prompt_layers.get("developer", ""), base_payload, heading_fields),
+            user_parts=_split_layer(prompt_layers.get("user", ""), base_payload, heading_fields),
+        )
 
-        system_message = system_template.format_map(format_payload) if system_template else ""
-        developer_message = developer_template.format_map(format_payload) if developer_template else ""
-        user_message = user_template.format_map(format_payload) if user_template else ""
+    def _build_prompt_messages(
+        self,
+        heading: str,
+        level: str,
+        context: PipelineContext,
+        section_goal: Optional[str] = None,
+        static: Optional[PromptStatic] = None,
+    ) -> List[Dict[str, str]]:
+        """Build layered prompt messages (system/developer/user)."""
+        if static is None:
+            static = self._precompute_prompt_static(context)
+        prompt_layers = static.prompt_layers
+        section_goal = section_goal or self._derive_section_goal(heading, context, static)
+
+        format_payload = ChainMap(
+            {
+                "heading": heading,
+                "level": level.upper(),
+                "primary_keyword": context.primary_keyword or heading,
+                "section_goal": section_goal,
+            },
+            static.base_payload,
+        )
+
+        system_message = static.system_message
+        if system_message is None:
+            system_template = prompt_layers.get("system", "")
+            system_message = system_template.format_map(format_payload) if system_template else ""
+        developer_message = static.developer_message
+        if developer_message is None:
+            developer_template = prompt_layers.get("developer", "")
+            developer_message = developer_template.format_map(format_payload) if developer_template else ""
+        if static.user_parts is not None:
+            user_message = "".join(
+                text + (slot.format_map(format_payload) if slot else "") for text, slot in static.user_parts
+            )
+        else:
+            user_template = prompt_layers.get("user", "")
+            user_message = user_template.format_map(format_payload) if user_template else ""
 
-        if self._is_b2b_context(context):
+        if static.is_b2b:
             b2b_style_note = (
                 "スタイル注意事項:\n"
                 "- 例や事例は最低7割以上をB2B（SaaS、製造業、BtoBサービスなど）から選ぶ\n"
@@ -1292,48 +1811,63 @@ class DraftGenerationPipeline:
     @staticmethod
     def _render_reader_profile(persona: Dict[str, Any], default_tone: str) -> str:
         name = persona.get("name") or "読者"
-        goals = " / ".join(persona.get("goals", [])[:3]) or "意思決定に役立つ情報を得たい"
-        pains = " / ".join(persona.get("pain_points", [])[:3]) or "確かな根拠が集まらない"
+        goals = " / ".join(islice(persona.get("goals", []), 3)) or "意思決定に役立つ情報を得たい"
+        pains = " / ".join(islice(persona.get("pain_points", []), 3)) or "確かな根拠が集まらない"
         tone = persona.get("tone") or default_tone
         return f"{name}（トーン: {tone}） | 目標: {goals} | 課題: {pains}"
 
-    def _derive_section_goal(self, heading: str, context: PipelineContext) -> str:
+    @staticmethod
+    def _section_goal_parts(context: PipelineContext) -> Tuple[str, str]:
+        """Return the draft-constant (persona name, mission clause) used in section goals."""
         persona_name = context.persona.get("name") or "読者"
         mission = context.writer_persona.get("mission") if isinstance(context.writer_persona, dict) else None
-        mission_clause = mission or "迷いを解いて行動を後押しする"
+        return persona_name, mission or "迷いを解いて行動を後押しする"
+
+    @staticmethod
+    def _format_section_goal(heading: str, persona_name: str, mission_clause: str) -> str:
         return f"{persona_name}が「{heading}」を理解し、{mission_clause}"
 
+    def _derive_section_goal(self, heading: str, context: PipelineContext, static: Optional[PromptStatic] = None) -> str:
+        if static is not None:
+            return self._format_section_goal(heading, static.reader_name, static.mission_clause)
+        return self._format_section_goal(heading, *self._section_goal_parts(context))
+
     @staticmethod
     def _scan_phrases(texts: List[str], phrases: List[str]) -> List[str]:
-        hits: List[str] = []
-        for phrase in phrases:
-            for text in texts:
-                if phrase and phrase in text:
-                    hits.append(phrase)
-                    break
-        return hits
+        # One C-level substring search per phrase over a single buffer. The NUL separator
+        # keeps a phrase from matching across two texts, and unlike a regex alternation
+        # overlapping phrases are all still reported, in phrase order.
+        corpus = "\0".join(texts)
+        return [phrase for phrase in phrases if phrase and phrase in corpus]
 
     @staticmethod
-    def _count_hits(text: str, keywords: List[str]) -> int:
+    def _count_hits(text: str, keywords: Sequence[str]) -> int:
         """Count occurrences of keywords in text."""
-        count = 0
-        for keyword in keywords:
-            if not keyword:
-                continue
-            count += len(re.findall(re.escape(keyword), text))
-        return count
+        # An escaped literal pattern matches exactly like str.count: left to right, non-overlapping.
+        return sum(text.count(keyword) for keyword in keywords if keyword)
+
+    @staticmethod
+    def _compile_source_matcher(preferred_patterns: List[str]) -> Optional[Pattern[str]]:
+        """Collapse preferred source patterns into one case-insensitive alternation."""
+        if not preferred_patterns:
+            return None
+        return re.compile("|".join(re.escape(pattern.lower()) for pattern in preferred_patterns))
 
     @staticmethod
-    def _prioritize_sources(sources: List[Dict[str, Any]], preferred_patterns: List[str]) -> List[Dict[str, Any]]:
+    def _prioritize_sources(
+        sources: List[Dict[str, Any]],
+        preferred_patterns: List[str],
+        matcher: Optional[Pattern[str]] = None,
+    ) -> List[Dict[str, Any]]:
         if not sources or not preferred_patterns:
             return list(sources)
+        if matcher is None:
+            matcher = DraftGenerationPipeline._compile_source_matcher(preferred_patterns)
+        search = matcher.search
 
         def score(entry: Dict[str, Any]) -> int:
             target = (entry.get("uri") or entry.get("url") or entry.get("title") or "").lower()
-            for pattern in preferred_patterns:
-                if pattern.lower() in target:
-                    return 0
-            return 1
+            return 0 if search(target) else 1
 
         return sorted(sources, key=score)
 
@@ -1369,7 +1903,7 @@ class DraftGenerationPipeline:
         max_workers = max(1, configured_workers)
         processed_count = min(paragraph_total, 3) if sample_mode else paragraph_total
         save_variants = os.getenv("SAVE_AB_VARIANTS", "false").lower() == "true"
-        original_sections = deepcopy(sections) if save_variants else None
+        original_sections = _clone_json(sections) if save_variants else None
 
         logger.info(
             "Job %s: starting style rewrite (paragraphs=%d, sample=%s, workers=%d)",
@@ -1401,7 +1935,7 @@ class DraftGenerationPipeline:
         }
         if save_variants and original_sections is not None:
             diagnostics["sections_original"] = original_sections
-            diagnostics["sections_rewritten"] = deepcopy(rewritten_sections)
+            diagnostics["sections_rewritten"] = _clone_json(rewritten_sections)
         logger.info(
             "Job %s: style rewrite completed in %.2fs (%.2fs/paragraph)",
             context.job_id,
@@ -1432,9 +1966,9 @@ class DraftGenerationPipeline:
         reader_note = ""
         if isinstance(outline, dict):
             reader_note = str(outline.get("reader_note") or "").strip()
+        # A trailing "\n" on an entry yields the blank line after it once the lines are joined.
         if reader_note:
-            lines.append(reader_note)
-            lines.append("")
+            lines.append(f"{reader_note}\n")
 
         for section in sections:
             h2_title = str(section.get("h2") or section.get("heading") or "").strip()
@@ -1444,8 +1978,7 @@ class DraftGenerationPipeline:
             for paragraph in section.get("paragraphs", []):
                 text = str(paragraph.get("text") or "").strip()
                 if text:
-                    lines.append(text)
-                    lines.append("")
+                    lines.append(f"{text}\n")
 
         return "\n".join(lines)
 
@@ -1454,8 +1987,6 @@ class DraftGenerationPipeline:
         """Normalize headings (single H1, strip template labels) and collapse blank lines."""
         if not markdown_snapshot:
             return markdown_snapshot
-        import re
-
         lines = markdown_snapshot.splitlines()
         normalized: List[str] = []
         first_h1_seen = False
@@ -1527,8 +2058,6 @@ class DraftGenerationPipeline:
         """Remove internal template labels from headings."""
         if not text:
             return text
-        import re
-
         cleaned = re.sub(r"^リード文[:：]\s*", "", text)
         cleaned = re.sub(r"^(Q/U:|E/S:|T:)\s*", "", cleaned)
         cleaned = re.sub(r"\b(QUEST|PREP|FAB|PAS)\b[:：]?\s*", "", cleaned, flags=re.IGNORECASE)
@@ -1540,9 +2069,10 @@ class DraftGenerationPipeline:
         """Remove duplicated heading text from the start of a paragraph."""
         if not text:
             return text
-        import re
-
         t = text.lstrip()
+        # Both patterns are anchored, so skip regex work unless the paragraph could match.
+        if not (t.startswith("#") or t.startswith(heading)):
+            return t
         patterns = [
             rf"^#+\s*{re.escape(heading)}\s*",
             rf"^{re.escape(heading)}\s*[:：]?\s*",
@@ -1558,9 +2088,9 @@ class DraftGenerationPipeline:
         """Demote in-paragraph Markdown headings to plain text."""
         if not text:
             return text
-        import re
-
         lines = text.splitlines()
+        if "#" not in text:
+            return "\n".join(lines)
         cleaned_lines = []
         for line in lines:
             if re.match(r"^\s*#{2,6}\s+\S+", line):
@@ -1574,8 +2104,6 @@ class DraftGenerationPipeline:
         """Trim paragraph content for refine prompt while preserving sentence boundaries."""
         if not text or len(text) <= limit:
             return text
-        import re
-
         trimmed = ""
         for sentence in re.split(r"(?<=[。．？?！!])|\n", text):
             if not sentence:
@@ -1606,10 +2134,7 @@ class DraftGenerationPipeline:
         if not markdown_snapshot.strip():
             return []
 
-        warnings: List[str] = []
-        warnings.extend(self.structure_validator.validate_headings(markdown_snapshot))
-        warnings.extend(self.structure_validator.validate_sentence_length(markdown_snapshot))
-        warnings.extend(self.structure_validator.check_style_consistency(markdown_snapshot))
+        warnings = self.structure_validator.validate_all(markdown_snapshot)
 
         deduped: List[str] = []
         seen = set()
@@ -1620,12 +2145,7 @@ class DraftGenerationPipeline:
         return deduped
 
     def _generate_editor_checklist(self, warnings: List[str]) -> str:
-        template_path = Path(__file__).resolve().parents[3] / "shared" / "prompts" / "editor_checklist.txt"
-        try:
-            template = template_path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            template = "自動検出された警告:\n{{VALIDATION_WARNINGS}}"
-
+        template = _editor_checklist_template()
         warnings_text = "\n".join(f"- {warning}" for warning in warnings) if warnings else "（特になし）"
         return template.replace("{{VALIDATION_WARNINGS}}", warnings_text)
 
@@ -1644,6 +2164,13 @@ class DraftGenerationPipeline:
             logger.error("AI Gateway not available - cannot generate content")
             raise RuntimeError("AI Gateway is not initialized. Please configure OPENAI_API_KEY or GCP credentials.")
 
+        cache_path = self._response_cache_path(prompt, messages, temperature, max_tokens)
+        if cache_path is not None:
+            cached = self._read_cached_response(cache_path)
+            if cached is not None:
+                logger.info("Reusing cached content: %d characters", len(cached.get("text", "")))
+                return cached
+
         try:
             result = self.ai_gateway.generate_with_grounding(
                 prompt=prompt,
@@ -1652,6 +2179,8 @@ class DraftGenerationPipeline:
                 max_tokens=max_tokens,
             )
             logger.info("Generated content: %d characters", len(result.get("text", "")))
+            if cache_path is not None:
+                self._write_cached_response(cache_path, result)
             return result
         except Exception as e:
             # 失敗時もプロンプトを残す
@@ -1664,6 +2193,116 @@ class DraftGenerationPipeline:
             logger.error("Content generation failed: %s", e)
             raise
 
+    def _response_cache_path(
+        self,
+        prompt: Optional[str],
+        messages: Optional[List[Dict[str, str]]],
+        temperature: float,
+        max_tokens: Optional[int],
+    ) -> Optional[Path]:
+        """Content-addressed location of a cached LLM response (controlled via LLM_CACHE_ENABLED).
+
+        Only deterministic (temperature 0) requests are cached; a sampled reply is one
+        draw among many and replaying it would pin every later job to the same text.
+        """
+        if not getattr(self.settings, "llm_cache_enabled", False) or temperature:
+            return None
+        try:
+            key_source = _dumps_json(
+                {
+                    "provider": getattr(self.ai_gateway, "provider", None),
+                    "model": getattr(self.ai_gateway, "model", None),
+                    "p": prompt,
+                    "m": messages,
+                    "t": temperature,
+                    "x": max_tokens,
+                }
+            )
+        except TypeError:
+            return None
+        digest = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        return Path(self.settings.llm_cache_dir) / f"{digest}.json"
+
+    def _read_cached_response(self, path: Path) -> Optional[Dict[str, Any]]:
+        ttl = int(getattr(self.settings, "llm_cache_ttl_seconds", 0) or 0)
+        try:
+            if ttl > 0 and time.time() - path.stat().st_mtime > ttl:
+                path.unlink(missing_ok=True)
+                return None
+            cached = _loads_json(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return cached if isinstance(cached, dict) else None
+
+    def _write_cached_response(self, path: Path, result: Dict[str, Any]) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            created = not path.exists()
+            # Write to a sibling file first so concurrent readers never see a partial entry.
+            tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp_path.write_text(_dumps_json(result), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug("Skipping LLM response cache write for %s: %s", path.name, exc)
+            return
+        if created:
+            self._evict_cached_responses(path.parent)
+
+    def _evict_cached_responses(self, cache_dir: Path) -> None:
+        """Trim the cache to 90% of LLM_CACHE_MAX_ENTRIES once a new entry pushes it past the cap.
+
+        The directory is only scanned when the tracked count reaches the cap; trimming below
+        it leaves room for roughly a tenth of the cap in new entries before the next scan.
+        Expired entries removed on read are not subtracted, which only brings a scan forward.
+        """
+        max_entries = int(getattr(self.settings, "llm_cache_max_entries", 0) or 0)
+        if max_entries <= 0:
+            return
+        key = str(cache_dir)
+        with _RESPONSE_CACHE_LOCK:
+            count = _RESPONSE_CACHE_COUNTS.get(key)
+            if count is not None and count < max_entries:
+                _RESPONSE_CACHE_COUNTS[key] = count + 1
+                return
+            entries = self._cached_response_entries(cache_dir)
+            keep = len(entries)
+            if keep > max_entries:
+                keep = max(max_entries * 9 // 10, 1)
+                for _mtime, entry in heapq.nsmallest(len(entries) - keep, entries):
+                    entry.unlink(missing_ok=True)
+            _RESPONSE_CACHE_COUNTS[key] = keep
+
+    @staticmethod
+    def _cached_response_entries(cache_dir: Path) -> List[Tuple[float, Path]]:
+        entries = []
+        for entry in cache_dir.glob("*.json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry))
+            except OSError:
+                continue
+        return entries
+
+    def _generate_grounded_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit independent generation requests together and return results in request order.
+
+        Each request holds the keyword arguments of _generate_grounded_content. The gateway
+        client is shared per process, so the calls reuse its pooled connections.
+        """
+        if not requests:
+            return []
+        if len(requests) == 1 or self.max_workers <= 1:
+            return [self._generate_grounded_content(**request) for request in requests]
+        executor = _shared_executor()
+        futures = [executor.submit(self._generate_grounded_content, **request) for request in requests]
+        if not getattr(_SHARED_EXECUTOR_THREAD, "active", False):
+            return [future.result() for future in futures]
+        # Called from a pool thread (e.g. the FAQ side task): run whatever no thread has picked
+        # up yet here instead of blocking on our own queue, which could deadlock a full pool.
+        return [
+            self._generate_grounded_content(**request) if future.cancel() else future.result()
+            for future, request in zip(futures, requests)
+        ]
+
     def _log_prompt_snapshot(
         self,
         prompt: Optional[str],
@@ -1693,12 +2332,22 @@ class DraftGenerationPipeline:
         label = f"stage={stage} heading={heading} level={level} job_id={job_id} draft_id={draft_id} provider={provider} model={model}"
 
         if messages:
-            rendered_messages = []
-            for entry in messages:
+            # Only render one character past the preview budget; that is enough to know
+            # the snapshot was truncated without copying whole prompts into the log line.
+            limit = max_chars + 1 if max_chars > 0 else None
+            rendered_parts: List[str] = []
+            rendered_length = 0
+            for index, entry in enumerate(messages):
+                if limit is not None and rendered_length >= limit:
+                    break
                 role = str(entry.get("role") or "unknown")
                 content = str(entry.get("content") or "")
-                rendered_messages.append(f"{role}: {content}")
-            text_blob = "\n---\n".join(rendered_messages)
+                prefix = f"\n---\n{role}: " if index else f"{role}: "
+                if limit is not None:
+                    content = content[: max(limit - rendered_length - len(prefix), 0)]
+                rendered_parts.append(prefix + content)
+                rendered_length += len(prefix) + len(content)
+            text_blob = "".join(rendered_parts)
         else:
             text_blob = str(prompt or "")
 
@@ -1719,19 +2368,28 @@ class DraftGenerationPipeline:
         persona_name = context.persona.get("name", "読者")
         pain_points = context.persona.get("pain_points", [])
 
-        faq_items = []
-        for pain in pain_points[:3]:
-            prompt = f"{persona_name}が抱える「{pain}」という課題に対する解決策を簡潔に説明してください。"
-            result = self._generate_grounded_content(
-                prompt,
-                temperature=context.llm_temperature,
-                log_info={
-                    "stage": "faq",
-                    "heading": f"FAQ: {pain}",
-                    "job_id": context.job_id,
-                    "draft_id": context.draft_id,
-                },
+        target_pains = pain_points[:3]
+        results: List[Dict[str, Any]] = []
+        if target_pains:
+            # Each FAQ answer is an independent LLM round-trip; submit them as one batch.
+            results = self._generate_grounded_batch(
+                [
+                    {
+                        "prompt": f"{persona_name}が抱える「{pain}」という課題に対する解決策を簡潔に説明してください。",
+                        "temperature": context.llm_temperature,
+                        "log_info": {
+                            "stage": "faq",
+                            "heading": f"FAQ: {pain}",
+                            "job_id": context.job_id,
+                            "draft_id": context.draft_id,
+                        },
+                    }
+                    for pain in target_pains
+                ]
             )
+
+        faq_items = []
+        for pain, result in zip(target_pains, results):
             raw_answer = result.get("text")
             normalized_answer = raw_answer.strip() if isinstance(raw_answer, str) else ""
             answer_text = normalized_answer or "課題に対する実務的な解決策を提示します。"
@@ -1773,7 +2431,7 @@ class DraftGenerationPipeline:
             )
             fixed_text = str(result.get("text") or "").strip()
             normalized = self._strip_json_fence(fixed_text)
-            parsed = json.loads(normalized)
+            parsed = _loads_json(normalized)
             if isinstance(parsed, dict):
                 return parsed
         except Exception as exc:
@@ -1820,7 +2478,7 @@ class DraftGenerationPipeline:
             '  "differentiation_angle": "競合記事との差別化視点"\n'
             "}\n\n"
             "最初のH2で示す結論は definition と success_keys を組み合わせ、一文でタイトルと噛み合う形にしてください。\n\n"
-            f"入力データ:\n{json.dumps(payload, ensure_ascii=False)}"
+            f"入力データ:\n{_dumps_json(payload)}"
         )
         result_payload: Dict[str, Any] = {}
         # Ensure prompt snapshot is emitted even if downstream parsing fails.
@@ -1846,7 +2504,7 @@ class DraftGenerationPipeline:
             )
             raw_text = str(result.get("text") or "").strip()
             normalized = self._strip_json_fence(raw_text)
-            parsed = json.loads(normalized)
+            parsed = _loads_json(normalized)
             if isinstance(parsed, dict):
                 result_payload = parsed
         except Exception as exc:
@@ -1863,7 +2521,7 @@ class DraftGenerationPipeline:
         def _sanitize_list(items: Any) -> List[str]:
             if not isinstance(items, list):
                 return []
-            return [str(item).strip() for item in items if str(item).strip()]
+            return _clean_strs(items)
 
         why_now = _sanitize_list(result_payload.get("why_now"))
         if not why_now:
@@ -1924,11 +2582,7 @@ class DraftGenerationPipeline:
             logger.info("Job %s: skipping refine_draft (empty sections)", context.job_id)
             return draft
 
-        outline_headings = [
-            str(section.get("text") or "").strip()
-            for section in outline.get("h2", [])
-            if str(section.get("text") or "").strip()
-        ]
+        outline_headings = _clean_strs([section.get("text") or "" for section in outline.get("h2", [])])
 
         trimmed_sections: List[Dict[str, Any]] = []
         for section in sections[:10]:
@@ -1950,12 +2604,12 @@ class DraftGenerationPipeline:
             "claims": draft.get("claims", []),
             "conclusion": conclusion or {},
         }
-        prompt_json = json.dumps(prompt_payload, ensure_ascii=False)
+        prompt_json = _dumps_json(prompt_payload)
         conclusion_clause = ""
         if conclusion:
             success_keys = []
             if isinstance(conclusion.get("success_keys"), list):
-                success_keys = [str(item).strip() for item in conclusion["success_keys"] if str(item).strip()]
+                success_keys = _clean_strs(conclusion["success_keys"])
             conclusion_fragments = []
             if conclusion.get("main_conclusion"):
                 conclusion_fragments.append(f"結論: {conclusion['main_conclusion']}")
@@ -1966,29 +2620,7 @@ class DraftGenerationPipeline:
             if conclusion_fragments:
                 conclusion_clause = "\n- 以下の結論を軸に一貫性を保つこと: " + " / ".join(conclusion_fragments)
         instruction = (
-            "あなたはシニアSEO編集長です。以下のJSONで渡すドラフトを推敲し、"
-            "論理構成・重複・専門用語・結論との整合性を整えてください。\n\n"
-            "必ず下記のフォーマットでJSONのみを出力してください:\n"
-            "{\n"
-            '  "sections": [\n'
-            '    {"h2": "見出し", "paragraphs": [{"text": "本文", "citations": ["..."]}]}\n'
-            "  ],\n"
-            '  "faq": [{"question": "...", "answer": "..."}],\n'
-            '  "claims": [{"id": "...", "text": "...", "citations": ["..."]}],\n'
-            '  "refinement_notes": ["修正内容のメモ"]\n'
-            "}\n\n"
-            "- 見出し数は必要に応じて微調整しても良いが、情報は削りすぎない\n"
-            "- 数値・引用URLは可能な限り保持し、変更した場合は notes に理由を書く\n"
-            "- 各 paragraph は具体的で重複のない文章にする\n"
-            "- FAQ/claims は要点のみ残し、不要な重複は削除\n"
-            "- refinement_notes にはユーザーが後から理解できる粒度で修正理由を列挙\n\n"
-            "- 見出しや本文に含まれるテンプレートのラベル（例:「リード文：」「Q/U:」「E/S:」「T:」「QUESTで提示」など）やフレームワーク名（QUEST/PREP/FAB/PAS等）は削除または自然な文章に置き換える\n"
-            "- Markdownの見出しレベルはH1をタイトルのみに1回だけ使用し、本文中はH2/H3のみを用いる。複数のH1があれば適切にH2/H3へ下げる。H2タイトルが重複する場合は内容が分かるよう具体的に書き換えてユニークにする\n"
-            "- 同じ内容を繰り返す段落は統合・削除し、各セクションが指定レンジに収まるよう過剰な部分は簡潔に要約する\n"
-            "- 「◯◯とは〜」のような定義文が複数回出る場合は、冒頭の定義だけ残し、以降は「この取り組み」「デジタル施策」などに言い換えて重複を避ける\n"
-            "- B2Cの例を挙げた場合はすぐ後に「B2Bでは〜」と1文で橋渡しを入れ、事例の7割以上をB2B（SaaS/製造業/法人向けサービス等）から選ぶ\n"
-            "- 1文に読点が3つ以上あるなど長すぎる場合は意味の切れ目で2〜3文に分割し、専門用語は初出のみ簡単な言い換え＋例を添える\n"
-            "- 数値は公的機関や一次情報を優先し、不確かなものは「約」「〜程度」にとどめる。1セクションあたりの数値は1〜3個に抑え、変更した場合は理由をnotesに記載\n\n"
+            f"{_REFINE_INSTRUCTION}"
             f"{conclusion_clause}\n"
             "=== 元ドラフト(JSON) ===\n"
             f"{prompt_json}\n"
@@ -2008,7 +2640,7 @@ class DraftGenerationPipeline:
             )
             raw_text = str(result.get("text") or "").strip()
             normalized_text = self._strip_json_fence(raw_text)
-            refined_payload = json.loads(normalized_text)
+            refined_payload = _loads_json(normalized_text)
         except Exception as exc:
             logger.warning("Job %s: refine_draft failed (%s)", context.job_id, exc)
             return draft
@@ -2024,31 +2656,31 @@ class DraftGenerationPipeline:
             if not isinstance(updated_sections, list) or not updated_sections:
                 return original_sections
             merged: List[Dict[str, Any]] = []
-            for idx, original in enumerate(original_sections):
-                updated = updated_sections[idx] if idx < len(updated_sections) else {}
+            # Sections the refiner dropped are merged against an empty update.
+            padded_updates = chain(updated_sections, repeat({}))
+            for original, updated in zip(original_sections, padded_updates):
                 new_h2 = str(updated.get("h2") or "").strip()
-                merged_section = {
-                    "h2": new_h2 or original.get("h2"),
-                    "paragraphs": [],
-                }
+                h2_value = new_h2 or original.get("h2")
+                base_paragraphs = original.get("paragraphs", [])
                 updated_paragraphs = updated.get("paragraphs") if isinstance(updated, dict) else None
                 if isinstance(updated_paragraphs, list) and updated_paragraphs:
+                    base_count = len(base_paragraphs)
+                    paragraphs: List[Dict[str, Any]] = []
                     for p_idx, paragraph in enumerate(updated_paragraphs):
-                        base_paragraphs = original.get("paragraphs", [])
-                        base = base_paragraphs[p_idx] if p_idx < len(base_paragraphs) else {}
+                        base = base_paragraphs[p_idx] if p_idx < base_count else {}
                         text = str(paragraph.get("text") or "").strip() or base.get("text", "")
                         citations = paragraph.get("citations")
                         if not citations and isinstance(base, dict):
                             citations = base.get("citations", [])
-                        merged_section["paragraphs"].append({
-                            "heading": paragraph.get("heading") or base.get("heading") or merged_section["h2"],
+                        paragraphs.append({
+                            "heading": paragraph.get("heading") or base.get("heading") or h2_value,
                             "text": text,
                             "citations": citations or [],
                             "claim_id": paragraph.get("claim_id") or base.get("claim_id"),
                         })
                 else:
-                    merged_section["paragraphs"] = original.get("paragraphs", [])
-                merged.append(merged_section)
+                    paragraphs = base_paragraphs
+                merged.append({"h2": h2_value, "paragraphs": paragraphs})
             if len(updated_sections) > len(original_sections):
                 for extra_section in updated_sections[len(original_sections):]:
                     heading = str(extra_section.get("h2") or "").strip() or "追加セクション"
@@ -2068,39 +2700,34 @@ class DraftGenerationPipeline:
 
         refined_sections = merge_sections()
 
-        def normalize_entries(original: List[Dict[str, Any]], updated: Any, required_keys: List[str], *, require_id: bool = False) -> List[Dict[str, Any]]:
+        def normalize_entries(
+            original: List[Dict[str, Any]], updated: Any, first_key: str, second_key: str
+        ) -> List[Dict[str, Any]]:
+            # Both FAQ and claim entries need exactly two non-empty fields, so they are read
+            # directly instead of looping over a key list.
             if not isinstance(updated, list) or not updated:
                 return original
             sanitized: List[Dict[str, Any]] = []
-            for idx, item in enumerate(updated):
+            for item in updated:
                 if not isinstance(item, dict):
                     continue
-                entry: Dict[str, Any] = {}
-                for key in required_keys:
-                    value = item.get(key)
-                    if isinstance(value, str):
-                        entry[key] = value.strip()
-                    else:
-                        entry[key] = value
-                if any(not entry.get(key) for key in required_keys):
+                first = item.get(first_key)
+                second = item.get(second_key)
+                if isinstance(first, str):
+                    first = first.strip()
+                if isinstance(second, str):
+                    second = second.strip()
+                if not first or not second:
                     continue
-                if require_id and not entry.get("id"):
-                    entry["id"] = f"{context.draft_id}-claim-{len(sanitized)+1}"
-                entry["citations"] = item.get("citations", [])
-                sanitized.append(entry)
+                sanitized.append({first_key: first, second_key: second, "citations": item.get("citations", [])})
             return sanitized or original
 
-        refined_faq = normalize_entries(draft.get("faq", []), refined_payload.get("faq"), ["question", "answer"])
-        refined_claims = normalize_entries(
-            draft.get("claims", []),
-            refined_payload.get("claims"),
-            ["id", "text"],
-            require_id=True,
-        )
+        refined_faq = normalize_entries(draft.get("faq", []), refined_payload.get("faq"), "question", "answer")
+        refined_claims = normalize_entries(draft.get("claims", []), refined_payload.get("claims"), "id", "text")
 
         notes = []
         if isinstance(refined_payload.get("refinement_notes"), list):
-            notes = [str(note).strip() for note in refined_payload["refinement_notes"] if str(note).strip()]
+            notes = _clean_strs(refined_payload["refinement_notes"])
 
         refined_draft = dict(draft)
         refined_draft["sections"] = refined_sections
@@ -2131,24 +2758,24 @@ class DraftGenerationPipeline:
             elif isinstance(draft.get("draft"), dict):
                 sections_payload = draft["draft"].get("sections", [])
 
-        key_points: List[str] = []
-        for section in sections_payload:
-            heading = str(section.get("h2") or section.get("heading") or "").strip()
-            snippet = ""
-            paragraphs = section.get("paragraphs", [])
-            if isinstance(paragraphs, list):
-                for paragraph in paragraphs:
-                    text = str(paragraph.get("text") or "").strip()
-                    if text:
-                        snippet = re.sub(r"\s+", " ", text)[:200]
-                        break
-            if heading or snippet:
-                fragment = f"{heading}: {snippet}" if heading and snippet else heading or snippet
-                fragment = fragment.strip()
-                if fragment:
-                    key_points.append(fragment)
-            if len(key_points) >= 3:
-                break
+        def iter_key_points():
+            for section in sections_payload:
+                heading = str(section.get("h2") or section.get("heading") or "").strip()
+                snippet = ""
+                paragraphs = section.get("paragraphs", [])
+                if isinstance(paragraphs, list):
+                    for paragraph in paragraphs:
+                        text = str(paragraph.get("text") or "").strip()
+                        if text:
+                            snippet = self._collapse_snippet(text, 200)
+                            break
+                if heading or snippet:
+                    fragment = f"{heading}: {snippet}" if heading and snippet else heading or snippet
+                    fragment = fragment.strip()
+                    if fragment:
+                        yield fragment
+
+        key_points: List[str] = list(islice(iter_key_points(), 3))
 
         if not key_points and provisional_title:
             key_points.append(provisional_title)
@@ -2168,13 +2795,9 @@ class DraftGenerationPipeline:
                 conclusion_line = f"最終結論: {main_text}\n"
             supporting_points = []
             if isinstance(conclusion.get("success_keys"), list):
-                supporting_points = [
-                    str(point).strip() for point in conclusion["success_keys"] if str(point).strip()
-                ]
+                supporting_points = _clean_strs(conclusion["success_keys"])
             if not supporting_points and isinstance(conclusion.get("supporting_points"), list):
-                supporting_points = [
-                    str(point).strip() for point in conclusion.get("supporting_points", []) if str(point).strip()
-                ]
+                supporting_points = _clean_strs(conclusion.get("supporting_points", []))
             if supporting_points:
                 support_clause = "結論を支える要素:\n" + "\n".join(f"- {point}" for point in supporting_points[:3]) + "\n"
         prompt = (
@@ -2219,6 +2842,16 @@ class DraftGenerationPipeline:
             "title_rationale": f"要点: {rationale_source}",
         }
 
+    @staticmethod
+    def _collapse_snippet(text: str, limit: int) -> str:
+        """Return the first ``limit`` characters of ``text`` with whitespace runs collapsed."""
+        # Collapsing never lengthens text, so a prefix usually suffices; long whitespace
+        # runs can shrink it below the limit, in which case the full text is collapsed.
+        head = _WHITESPACE_RUN_RE.sub(" ", text[: limit + limit // 2])
+        if len(head) < limit and len(text) > limit + limit // 2:
+            head = _WHITESPACE_RUN_RE.sub(" ", text)
+        return head[:limit]
+
     def generate_meta(self, prompt: Dict, context: PipelineContext, final_title: Optional[str] = None) -> Dict:
         keyword = prompt["primary_keyword"]
         keyword_surface = self._sanitize_keyword_surface(keyword)
@@ -2252,12 +2885,13 @@ class DraftGenerationPipeline:
         keyword_surface = self._sanitize_keyword_surface(keyword)
         persona_goals = context.persona.get("goals", [])
 
-        if not self.link_repository or not self.link_repository.is_enabled:
+        repository = self.link_repository if self.link_repository is not None else _get_link_repository()
+        if not repository or not repository.is_enabled:
             logger.info("Link repository not available; skipping internal link suggestions")
             return []
 
         try:
-            candidates = self.link_repository.search(keyword, persona_goals, limit=5)
+            candidates = self._search_internal_links(repository, keyword, persona_goals)
             results = []
             for candidate in candidates:
                 results.append({
@@ -2273,6 +2907,24 @@ class DraftGenerationPipeline:
             logger.error("Link proposal failed: %s", e)
             return []
 
+    @staticmethod
+    def _search_internal_links(
+        repository: InternalLinkRepository, keyword: str, persona_goals: List[str]
+    ) -> List[Dict]:
+        """Query the link repository through a short-lived cache keyed by keyword and goals."""
+        cache_key = (keyword, tuple(sorted(str(goal) for goal in persona_goals)))
+        with _LINK_SEARCH_LOCK:
+            cached = _LINK_SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Internal link cache hit for keyword: %s", keyword)
+            return cached
+        candidates = repository.search(keyword, persona_goals, limit=5)
+        # Empty results may stem from transient BigQuery failures, so only cache hits.
+        if candidates:
+            with _LINK_SEARCH_LOCK:
+                _LINK_SEARCH_CACHE[cache_key] = candidates
+        return candidates
+
     def evaluate_quality(
         self,
         draft: Dict,
@@ -2286,32 +2938,36 @@ class DraftGenerationPipeline:
         if isinstance(draft, dict) and "sections" not in draft and isinstance(draft.get("draft"), dict):
             sections_payload = draft.get("draft", {})
         sections = sections_payload.get("sections", []) if isinstance(sections_payload, dict) else []
-        paragraphs = [p for section in sections for p in section.get("paragraphs", [])]
-        has_citations = any(p.get("citations") for p in paragraphs)
+        # Single walk over sections/paragraphs collects citations, text and headings together.
+        has_citations = False
         unique_citations = set()
         text_segments: List[str] = []
-        for paragraph in paragraphs:
-            text = paragraph.get("text", "")
-            if isinstance(text, str) and text.strip():
-                text_segments.append(text)
-            for citation in paragraph.get("citations", []):
-                if isinstance(citation, str):
-                    unique_citations.add(citation)
-                elif isinstance(citation, dict):
-                    uri = citation.get("uri") or citation.get("url")
-                    if uri:
-                        unique_citations.add(uri)
-
-        citation_count = len(unique_citations)
-        numeric_facts = sum(len(re.findall(r"\d+[\d,\.]*", text)) for text in text_segments)
-        ng_hits = self._scan_phrases(text_segments, NG_PHRASES)
-        abstract_hits = self._scan_phrases(text_segments, ABSTRACT_PATTERNS)
-
         headings: List[str] = []
         for section in sections:
             heading = str(section.get("h2") or section.get("heading") or "").strip()
             if heading:
                 headings.append(heading)
+            for paragraph in section.get("paragraphs", []):
+                text = paragraph.get("text", "")
+                if isinstance(text, str) and text.strip():
+                    text_segments.append(text)
+                citations = paragraph.get("citations", [])
+                if citations:
+                    has_citations = True
+                    # Paragraph citations are almost always plain URL strings; add them in one
+                    # bulk update and map dict entries to their URI (None when missing).
+                    unique_citations.update(
+                        citation if isinstance(citation, str) else citation.get("uri") or citation.get("url") or None
+                        for citation in citations
+                        if isinstance(citation, (str, dict))
+                    )
+        unique_citations.discard(None)
+
+        citation_count = len(unique_citations)
+        numeric_facts = sum(len(_NUMERIC_FACT_RE.findall(text)) for text in text_segments)
+        ng_hits = self._scan_phrases(text_segments, NG_PHRASES)
+        abstract_hits = self._scan_phrases(text_segments, ABSTRACT_PATTERNS)
+
         if outline and isinstance(outline, dict):
             for section in outline.get("h2", []):
                 heading = str(section.get("text") or "").strip()
@@ -2355,7 +3011,7 @@ class DraftGenerationPipeline:
             "similarity": duplication_score,
             "claims": claims_without_citations,
             "style_violations": deduped_flags,
-            "is_ymyl": context.article_type in {"information", "comparison"} and not has_citations,
+            "is_ymyl": context.article_type in _YMYL_TYPES and not has_citations,
             "rubric": writer_rubric,
             "rubric_summary": rubric_summary,
             "citation_count": citation_count,
@@ -2382,56 +3038,36 @@ class DraftGenerationPipeline:
             context.article_type,
         )
 
-        has_definition = bool(re.search(r"とは", first_block)) or bool(
-            re.search(rf"{re.escape(keyword_surface)}[^。\n]*とは", first_block)
-        )
-        has_intro = bool(re.search(r"(この記事|本記事|読み終わると|わかること)", first_block))
+        # Any "<keyword>…とは" match already contains "とは", so the plain check decides it.
+        has_definition = "とは" in first_block
+        has_intro = bool(_INTRO_PHRASE_RE.search(first_block))
         has_summary_heading = any("まとめ" in h or "結論" in h for h in headings[-2:]) if headings else False
 
-        foundational_terms = [
-            "SEO",
-            "コンテンツ",
-            "オウンド",
-            "SNS",
-            "メール",
-            "MA",
-            "マーケティングオートメーション",
-            "チャネル",
-            "施策",
-            "ファネル",
-        ]
-        measurement_terms = [
-            "GA4",
-            "Google広告",
-            "広告",
-            "計測",
-            "トラッキング",
-            "タグ",
-            "P-Max",
-            "PMax",
-            "アトリビューション",
-            "コンバージョン",
-            "BigQuery",
-            "DDA",
-        ]
-        foundation_hits = self._count_hits(full_text, foundational_terms)
-        measurement_hits = self._count_hits(full_text, measurement_terms)
+        foundation_hits = self._count_hits(full_text, _FOUNDATIONAL_TERMS)
+        measurement_hits = self._count_hits(full_text, _MEASUREMENT_TERMS)
         balance_ratio = (foundation_hits + 1) / (measurement_hits + 1)
 
         section_count = max(len(sections), 1)
         section_example_hits = 0
         for section in sections:
-            if any(re.search(r"(例|事例|ケース|例えば)", str(p.get("text", ""))) for p in section.get("paragraphs", [])):
+            if any(_EXAMPLE_PHRASE_RE.search(str(p.get("text", ""))) for p in section.get("paragraphs", [])):
                 section_example_hits += 1
         example_ratio = section_example_hits / section_count
 
-        sentences = [s for text in text_segments for s in re.split(r"[。！!？?]", text) if s.strip()]
-        avg_sentence_len = sum(len(s) for s in sentences) / len(sentences) if sentences else 0
-        desu_count = sum(text.count("です") + text.count("ます") for text in text_segments)
-        desu_ratio = desu_count / max(len(sentences), 1)
-        bullet_count = sum(
-            1 for text in text_segments for line in text.splitlines() if line.strip().startswith(("-", "・", "●", "*"))
-        )
+        # Sentence, です/ます and bullet statistics are independent sums; gather them in one walk.
+        sentence_count = 0
+        sentence_len_sum = 0
+        desu_count = 0
+        bullet_count = 0
+        for text in text_segments:
+            for sentence in _SENTENCE_END_RE.split(text):
+                if sentence.strip():
+                    sentence_count += 1
+                    sentence_len_sum += len(sentence)
+            desu_count += text.count("です") + text.count("ます")
+            bullet_count += sum(1 for line in text.splitlines() if line.strip().startswith(("-", "・", "●", "*")))
+        avg_sentence_len = sentence_len_sum / sentence_count if sentence_count else 0
+        desu_ratio = desu_count / max(sentence_count, 1)
 
         def clamp_score(value: float) -> int:
             return max(1, min(5, int(round(value))))
@@ -2458,14 +3094,11 @@ class DraftGenerationPipeline:
             + (1 if numeric_facts >= 3 else 0)
         )
 
-        title_has_keyword = False
-        if title_text:
-            title_has_keyword = keyword_surface in title_text or f"{keyword_surface}とは" in title_text
-        heading_coverage = sum(
-            1
-            for key in ("チャネル", "施策", "KPI", "成功", "失敗", "まとめ")
-            if any(key in h for h in headings)
-        )
+        # "<keyword>とは" in the title already contains the keyword itself.
+        title_has_keyword = bool(title_text) and keyword_surface in title_text
+        # NUL-joined so a key can only match inside a single heading.
+        joined_headings = "\0".join(headings)
+        heading_coverage = sum(1 for key in _HEADING_COVERAGE_KEYS if key in joined_headings)
         heading_score = clamp_score(
             2
             + (2 if title_has_keyword or not title_text else -1 if is_glossary else 0)
@@ -2578,7 +3211,7 @@ class DraftGenerationPipeline:
             metadata["notation_guidelines"] = context.notation_guidelines
         if context.writer_persona:
             try:
-                metadata["writer_persona"] = json.dumps(context.writer_persona, ensure_ascii=False)
+                metadata["writer_persona"] = _dumps_json(context.writer_persona)
             except TypeError:
                 metadata["writer_persona"] = str(context.writer_persona)
         if context.preferred_sources:
@@ -2616,9 +3249,10 @@ class DraftGenerationPipeline:
     def run(self, payload: Dict) -> Dict:
         start_time = time.time()
         job_id = payload["job_id"]
+        pg = payload.get
         logger.info("Starting pipeline for job %s", job_id)
-        draft_id = payload.get("draft_id") or str(job_id).replace("-", "")[:12]
-        llm_override_raw = payload.get("llm")
+        draft_id = pg("draft_id") or str(job_id).replace("-", "")[:12]
+        llm_override_raw = pg("llm")
         if isinstance(llm_override_raw, dict):
             llm_override = dict(llm_override_raw)
         elif isinstance(llm_override_raw, str):
@@ -2652,50 +3286,49 @@ class DraftGenerationPipeline:
                     logger.error("Fallback AI gateway initialization failed for job %s: %s", job_id, gateway_exc)
 
         intent = self.estimate_intent(payload)
-        heading_directive = payload.get("heading_directive") or {}
+        heading_directive = pg("heading_directive") or {}
         heading_mode = heading_directive.get("mode", "auto")
         heading_overrides: List[str] = heading_directive.get("headings") or []
         if isinstance(heading_overrides, str):
             heading_overrides = [line.strip() for line in heading_overrides.splitlines() if line.strip()]
 
-        reference_urls_raw = payload.get("reference_urls") or []
+        reference_urls_raw = pg("reference_urls") or []
         if isinstance(reference_urls_raw, str):
-            reference_urls = [url.strip() for url in reference_urls_raw.splitlines() if url.strip()]
+            reference_urls = _clean_strs(reference_urls_raw.splitlines())
         else:
-            reference_urls = [str(url).strip() for url in reference_urls_raw if str(url).strip()]
+            reference_urls = _clean_strs(reference_urls_raw)
 
         # Determine article type and expertise before loading project defaults
-        article_type = payload.get("article_type", "information")
-        keyword_preset = self._infer_keyword_preset(payload.get("primary_keyword", ""), article_type)
-        expertise_level = payload.get("expertise_level", "intermediate")
+        article_type = pg("article_type", "information")
+        keyword_preset = self._infer_keyword_preset(pg("primary_keyword", ""), article_type)
+        expertise_level = pg("expertise_level", "intermediate")
         expertise_level = self._coerce_expertise_level_for_preset(expertise_level, keyword_preset)
 
-        word_range_raw = payload.get("word_count_range")
+        word_range_raw = pg("word_count_range")
         if isinstance(word_range_raw, (list, tuple)) and len(word_range_raw) >= 2:
             word_count_range = f"{word_range_raw[0]}-{word_range_raw[1]}"
         else:
             word_count_range = self._coerce_word_count_for_preset(word_range_raw, keyword_preset)
 
-        project_id = payload.get("project_id") or self.settings.project_id
+        project_id = pg("project_id") or self._default_project_id
         project_defaults = get_project_defaults(project_id, expertise_level=expertise_level)
-        writer_persona_raw = payload.get("writer_persona") or project_defaults.get("writer_persona") or {}
+        dg = project_defaults.get
+        writer_persona_raw = pg("writer_persona") or dg("writer_persona") or {}
+        # The cached defaults share one persona dict across jobs, so each job works on a copy.
         writer_persona = dict(writer_persona_raw) if isinstance(writer_persona_raw, dict) else {}
-        preferred_sources_raw = payload.get("preferred_sources") or project_defaults.get("preferred_sources", [])
-        reference_media_raw = payload.get("reference_media") or project_defaults.get("reference_media", [])
-        preferred_sources = [
-            str(item).strip() for item in preferred_sources_raw if str(item).strip()
-        ]
-        reference_media = [
-            str(item).strip() for item in reference_media_raw if str(item).strip()
-        ]
-        site_context_raw = payload.get("site_context") or []
+        preferred_sources_raw = pg("preferred_sources") or dg("preferred_sources", [])
+        reference_media_raw = pg("reference_media") or dg("reference_media", [])
+        preferred_sources = _clean_strs(preferred_sources_raw)
+        reference_media = _clean_strs(reference_media_raw)
+        site_context_raw = pg("site_context") or []
         site_context: List[Dict[str, Any]] = []
         if isinstance(site_context_raw, list):
             for entry in site_context_raw:
                 if isinstance(entry, dict):
                     site_context.append(entry)
-        post_publish_metrics = payload.get("post_publish_metrics") if isinstance(payload.get("post_publish_metrics"), dict) else {}
-        prompt_layers = project_defaults.get("prompt_layers", {})
+        post_publish_metrics_raw = pg("post_publish_metrics")
+        post_publish_metrics = post_publish_metrics_raw if isinstance(post_publish_metrics_raw, dict) else {}
+        prompt_layers = dg("prompt_layers", {})
         llm_provider = self._active_llm.get("provider") or self.settings.llm_provider or "openai"
         llm_model = self._active_llm.get("model") or self._default_model_for_provider(llm_provider)
         llm_temperature = float(
@@ -2703,33 +3336,33 @@ class DraftGenerationPipeline:
             or llm_override.get("temperature")
             or 0.7
         )
-        serp_snapshot = self._normalize_serp_snapshot(payload.get("serp_snapshot"))
-        serp_gap_topics = self._derive_serp_gap_topics(serp_snapshot, payload.get("primary_keyword", ""))
+        serp_snapshot = self._normalize_serp_snapshot(pg("serp_snapshot"))
+        serp_gap_topics = self._derive_serp_gap_topics(serp_snapshot, pg("primary_keyword", ""))
 
         # Apply preset-specific defaults if word_count_range was not explicitly provided
-        tone = payload.get("tone", "formal")
+        tone = pg("tone", "formal")
 
         context = PipelineContext(
-            job_id=payload["job_id"],
+            job_id=job_id,
             draft_id=draft_id,
             project_id=project_id,
-            prompt_version=payload.get("prompt_version", self.settings.default_prompt_version),
+            prompt_version=pg("prompt_version", self._default_prompt_version),
             primary_keyword=payload["primary_keyword"],
-            persona=payload.get("persona", {}),
+            persona=pg("persona", {}),
             intent=intent,
             article_type=article_type,
-            cta=payload.get("intended_cta"),
+            cta=pg("intended_cta"),
             heading_mode=heading_mode,
             heading_overrides=heading_overrides,
-            quality_rubric=payload.get("quality_rubric"),
+            quality_rubric=pg("quality_rubric"),
             reference_urls=reference_urls,
-            output_format=payload.get("output_format", "html"),
-            notation_guidelines=payload.get("notation_guidelines"),
+            output_format=pg("output_format", "html"),
+            notation_guidelines=pg("notation_guidelines"),
             word_count_range=word_count_range,
             writer_persona=writer_persona,
             preferred_sources=preferred_sources,
             reference_media=reference_media,
-            project_template_id=payload.get("project_template_id"),
+            project_template_id=pg("project_template_id"),
             prompt_layers=prompt_layers,
             llm_provider=llm_provider,
             llm_model=llm_model,
@@ -2742,61 +3375,86 @@ class DraftGenerationPipeline:
             site_context=site_context,
             post_publish_metrics=post_publish_metrics or {},
         )
-        step_start = time.time()
-        conclusion = self.extract_conclusion(context)
-        logger.info("Job %s: conclusion extraction took %.2f seconds", job_id, time.time() - step_start)
-
-        step_start = time.time()
-        outline = self.generate_outline(context, payload, conclusion=conclusion)
-        logger.info("Job %s: outline generation took %.2f seconds", job_id, time.time() - step_start)
-        citations: List[Dict[str, Any]] = []
-        raw_citations = payload.get("citations") or []
-        for item in raw_citations:
-            if isinstance(item, dict):
-                citations.append(item)
-            elif isinstance(item, str):
-                citations.append({"url": item})
-        if not citations and context.reference_urls:
-            citations = [{"url": url} for url in context.reference_urls]
-        if not citations:
-            citations = [{"url": "https://www.google.com/search?q=" + payload["primary_keyword"]}]
-        step_start = time.time()
-        draft = self.generate_draft(context, outline, citations)
-        logger.info("Job %s: draft generation took %.2f seconds", job_id, time.time() - step_start)
-
-        step_start = time.time()
-        draft = self.refine_draft(context, outline, draft, conclusion=conclusion)
-        logger.info("Job %s: draft refinement took %.2f seconds", job_id, time.time() - step_start)
-        draft = self._strip_template_labels_in_draft(draft)
-        style_diagnostics = self._maybe_apply_style_rewrite(draft, context)
-        markdown_snapshot = self._render_markdown_snapshot(draft, outline, context)
-        markdown_snapshot = self._normalize_markdown_structure(markdown_snapshot)
-        structure_warnings = self._collect_structure_warnings(markdown_snapshot)
-        style_diagnostics["validation_warnings"] = structure_warnings
-        editor_checklist = self._generate_editor_checklist(structure_warnings)
-        style_diagnostics["editor_checklist"] = editor_checklist
-
-        step_start = time.time()
+        # Internal links and FAQ answers only need the payload/context, so run them
+        # alongside the conclusion -> outline -> draft chain instead of after it.
+        # The conclusion call is submitted first because the outline waits on it. They share
+        # the process-wide pool so side calls count against the same LLM_MAX_WORKERS bound.
+        executor = _shared_executor()
+        conclusion_future = executor.submit(self.extract_conclusion, context)
+        links_future = executor.submit(self.propose_links, payload, context)
+        faq_future = executor.submit(self._generate_faq, context)
+
+        side_futures = [conclusion_future, links_future, faq_future]
+
+        # If any step below raises, drop the side calls that have not started yet so a
+        # failed (and possibly redelivered) job stops holding shared-pool threads.
         try:
-            title_result = self.finalize_title(context, outline, draft, conclusion=conclusion)
-        except Exception as exc:
-            logger.exception("Job %s: finalize_title crashed (%s)", job_id, exc)
-            fallback_title = outline.get("provisional_title") or outline.get("title") or context.primary_keyword
-            title_result = {
-                "final_title": fallback_title,
-                "provisional_title": fallback_title,
-                "title_variants": [],
-                "title_rationale": "finalize_title fallback due to exception",
-            }
-        logger.info("Job %s: finalize_title took %.2f seconds", job_id, time.time() - step_start)
+            # The outline skeleton does not depend on the conclusion, so build it while the
+            # conclusion request is in flight and only merge the conclusion afterwards.
+            step_start = time.time()
+            outline = self._draft_outline(context, payload)
+            conclusion = conclusion_future.result()
+            logger.info("Job %s: conclusion extraction took %.2f seconds", job_id, time.time() - step_start)
+
+            step_start = time.time()
+            outline = self._finish_outline(outline, context, conclusion)
+            logger.info("Job %s: outline generation took %.2f seconds", job_id, time.time() - step_start)
+            raw_citations = pg("citations") or []
+            citations: List[Dict[str, Any]] = (
+                [
+                    build(item)
+                    for item in raw_citations
+                    if (build := _CITATION_BUILDERS.get(type(item))) is not None
+                ]
+                or [{"url": url} for url in context.reference_urls]
+                or [{"url": _search_fallback_url(payload["primary_keyword"])}]
+            )
+            step_start = time.time()
+            draft = self.generate_draft(context, outline, citations, faq_future=faq_future)
+            logger.info("Job %s: draft generation took %.2f seconds", job_id, time.time() - step_start)
+
+            step_start = time.time()
+            draft = self.refine_draft(context, outline, draft, conclusion=conclusion)
+            logger.info("Job %s: draft refinement took %.2f seconds", job_id, time.time() - step_start)
+            draft = self._strip_template_labels_in_draft(draft)
+            style_diagnostics = self._maybe_apply_style_rewrite(draft, context)
+
+            # The title only reads the finished draft, so its LLM call runs while the markdown
+            # snapshot is rendered and validated locally. Meta and quality need the title.
+            step_start = time.time()
+            title_future = _shared_executor().submit(self.finalize_title, context, outline, draft, conclusion=conclusion)
+            side_futures.append(title_future)
+
+            markdown_snapshot = self._render_markdown_snapshot(draft, outline, context)
+            markdown_snapshot = self._normalize_markdown_structure(markdown_snapshot)
+            structure_warnings = self._collect_structure_warnings(markdown_snapshot)
+            style_diagnostics["validation_warnings"] = structure_warnings
+            editor_checklist = self._generate_editor_checklist(structure_warnings)
+            style_diagnostics["editor_checklist"] = editor_checklist
 
-        step_start = time.time()
-        meta = self.generate_meta(payload, context, final_title=title_result.get("final_title"))
-        logger.info("Job %s: meta generation took %.2f seconds", job_id, time.time() - step_start)
+            try:
+                title_result = title_future.result()
+            except Exception as exc:
+                logger.exception("Job %s: finalize_title crashed (%s)", job_id, exc)
+                fallback_title = outline.get("provisional_title") or outline.get("title") or context.primary_keyword
+                title_result = {
+                    "final_title": fallback_title,
+                    "provisional_title": fallback_title,
+                    "title_variants": [],
+                    "title_rationale": "finalize_title fallback due to exception",
+                }
+            logger.info("Job %s: finalize_title took %.2f seconds", job_id, time.time() - step_start)
 
-        step_start = time.time()
-        links = self.propose_links(payload, context)
-        logger.info("Job %s: link proposal took %.2f seconds", job_id, time.time() - step_start)
+            step_start = time.time()
+            meta = self.generate_meta(payload, context, final_title=title_result.get("final_title"))
+            logger.info("Job %s: meta generation took %.2f seconds", job_id, time.time() - step_start)
+
+            step_start = time.time()
+            links = links_future.result()
+            logger.info("Job %s: link proposal wait took %.2f seconds", job_id, time.time() - step_start)
+        finally:
+            for future in side_futures:
+                future.cancel()
 
         step_start = time.time()
         quality = self.evaluate_quality(draft, context, outline=outline, title_result=title_result)
@@ -2836,9 +3494,7 @@ class DraftGenerationPipeline:
             main_conclusion = conclusion.get("main_conclusion")
             if main_conclusion:
                 metadata["main_conclusion"] = str(main_conclusion)
-            supporting_points = [
-                str(point).strip() for point in conclusion.get("supporting_points", []) if str(point).strip()
-            ]
+            supporting_points = _clean_strs(conclusion.get("supporting_points", []))
             if supporting_points:
                 metadata["conclusion_points"] = " / ".join(supporting_points[:3])
         total_time = time.time() - start_time
@@ -2846,8 +3502,44 @@ class DraftGenerationPipeline:
         return bundle
 
 
+# Redelivered copies of a message that is still being processed are acknowledged
+# without starting a second run of the same draft.
+_PUBSUB_INFLIGHT: set = set()
+_PUBSUB_INFLIGHT_LOCK = threading.Lock()
+# Each Pub/Sub worker thread keeps its own pipeline: instances carry per-job LLM
+# state, so one cannot be shared by concurrent jobs, but can be reused serially.
+_PUBSUB_PIPELINES = threading.local()
+
+
+def _pubsub_pipeline() -> DraftGenerationPipeline:
+    pipeline = getattr(_PUBSUB_PIPELINES, "pipeline", None)
+    if pipeline is None:
+        pipeline = _PUBSUB_PIPELINES.pipeline = DraftGenerationPipeline()
+    return pipeline
+
+
 def handle_pubsub_message(event, _context) -> Dict:
     # Expected to be Pub/Sub triggered Cloud Run job
-    data = json.loads(event["data"]) if isinstance(event, dict) and "data" in event else event
-    pipeline = DraftGenerationPipeline()
-    return pipeline.run(data)
+    data = _loads_json(event["data"]) if isinstance(event, dict) and "data" in event else event
+    job_id = data.get("job_id")
+    draft_id = data.get("draft_id")
+    # run() requires job_id; redelivering a message without one would fail forever.
+    if not job_id:
+        logger.error("Rejecting Pub/Sub message without job_id (draft_id=%s)", draft_id)
+        return {"status": "rejected", "reason": "missing_job_id"}
+    job_key = str(draft_id or job_id)
+    with _PUBSUB_INFLIGHT_LOCK:
+        if job_key in _PUBSUB_INFLIGHT:
+            logger.info("Job %s is already running; ignoring redelivered message", job_key)
+            return {"status": "duplicate", "job_id": job_id}
+        _PUBSUB_INFLIGHT.add(job_key)
+    # The run stays inside the delivery: the bundle is returned before the message is
+    # acked, and a failure propagates so Pub/Sub redelivers the job instead of losing it.
+    try:
+        return _pubsub_pipeline().run(data)
+    except Exception:
+        logger.exception("Pipeline failed for job %s", job_key)
+        raise
+    finally:
+        with _PUBSUB_INFLIGHT_LOCK:
+            _PUBSUB_INFLIGHT.discard(job_key)
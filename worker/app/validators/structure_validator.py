@@ -2,7 +2,18 @@ from __future__ import annotations
 
 import re
 from collections import Counter, defaultdict
-from typing import List
+from typing import Dict, List, Optional, Set
+
+_H2_LINE = re.compile(r"^##\s+(.+)$", re.MULTILINE)
+_H3_LINE = re.compile(r"^###\s+(.+)$")
+_SENTENCE_BREAK = re.compile(r"[。！？\n]")
+_INLINE_BREAK = re.compile(r"[。！？]")
+_MARKUP_CHARS = re.compile(r"[#>*_`\\[\\]\\(\\)]")
+_DEARU_PATTERNS = (
+    re.compile(r"[^。！？\s]{2,}である。"),
+    re.compile(r"[^。！？\s]{2,}にある。"),
+    re.compile(r"[^。！？\s]{2,}が中核である。"),
+)
 
 
 class StructureValidator:
@@ -15,8 +26,7 @@ class StructureValidator:
             return []
 
         warnings: List[str] = []
-        h2_pattern = re.compile(r"^##\s+(.+)$", re.MULTILINE)
-        h2_headings = [heading.strip() for heading in h2_pattern.findall(markdown) if heading.strip()]
+        h2_headings = [heading.strip() for heading in _H2_LINE.findall(markdown) if heading.strip()]
         h2_counts = Counter(h2_headings)
         for heading, count in h2_counts.items():
             if count > 1:
@@ -24,16 +34,15 @@ class StructureValidator:
 
         current_h2 = None
         h3_parent_map = defaultdict(set)
-        h3_pattern = re.compile(r"^###\s+(.+)$")
         for line in markdown.splitlines():
             line = line.rstrip()
             if not line:
                 continue
-            h2_match = h2_pattern.match(line)
+            h2_match = _H2_LINE.match(line)
             if h2_match:
                 current_h2 = h2_match.group(1).strip()
                 continue
-            h3_match = h3_pattern.match(line)
+            h3_match = _H3_LINE.match(line)
             if h3_match:
                 heading = h3_match.group(1).strip()
                 if heading:
@@ -51,11 +60,11 @@ class StructureValidator:
         if not markdown:
             return []
 
-        sentences = re.split(r"[。！？\n]", markdown)
+        sentences = _SENTENCE_BREAK.split(markdown)
         warnings: List[str] = []
 
         for idx, sentence in enumerate(sentences, 1):
-            cleaned = re.sub(r"[#>*_`\\[\\]\\(\\)]", "", sentence).strip()
+            cleaned = _MARKUP_CHARS.sub("", sentence).strip()
             if len(cleaned) > max_length:
                 snippet = cleaned[:50] + ("…" if len(cleaned) > 50 else "")
                 warnings.append(f"文{idx}が{len(cleaned)}文字です（推奨: {max_length}文字以内）: {snippet}")
@@ -68,15 +77,71 @@ class StructureValidator:
         if not markdown:
             return []
 
-        patterns = [
-            r"[^。！？\s]{2,}である。",
-            r"[^。！？\s]{2,}にある。",
-            r"[^。！？\s]{2,}が中核である。",
-        ]
         warnings: List[str] = []
-        for pattern in patterns:
-            matches = re.findall(pattern, markdown)
+        for pattern in _DEARU_PATTERNS:
+            matches = pattern.findall(markdown)
             if matches:
                 warnings.append(f"「である調」が検出されました: {', '.join(matches[:3])}")
 
         return warnings
+
+    @staticmethod
+    def validate_all(markdown: str, max_length: int = 80) -> List[str]:
+        """Run the heading, sentence-length and style checks over the lines in one pass.
+
+        Returns the same warnings, in the same order, as calling ``validate_headings``,
+        ``validate_sentence_length`` and ``check_style_consistency`` in turn.
+        """
+        if not markdown:
+            return []
+
+        # H2 duplicates keep the document-wide regex (its ``\s+`` may span blank lines).
+        h2_counts = Counter(heading.strip() for heading in _H2_LINE.findall(markdown) if heading.strip())
+        h3_parent_map: Dict[str, Set[str]] = defaultdict(set)
+        current_h2: Optional[str] = None
+        length_warnings: List[str] = []
+        style_matches: List[List[str]] = [[] for _ in _DEARU_PATTERNS]
+        sentence_index = 0
+
+        # Sentences never span a newline and the である調 patterns exclude whitespace,
+        # so the remaining checks can work on one line at a time.
+        for raw_line in markdown.split("\n"):
+            for sentence in _INLINE_BREAK.split(raw_line):
+                sentence_index += 1
+                cleaned = _MARKUP_CHARS.sub("", sentence).strip()
+                if len(cleaned) > max_length:
+                    snippet = cleaned[:50] + ("…" if len(cleaned) > 50 else "")
+                    length_warnings.append(
+                        f"文{sentence_index}が{len(cleaned)}文字です（推奨: {max_length}文字以内）: {snippet}"
+                    )
+            for found, pattern in zip(style_matches, _DEARU_PATTERNS):
+                found.extend(pattern.findall(raw_line))
+
+            if "##" not in raw_line:
+                continue
+            # validate_headings walks splitlines(), which also breaks on "\r" and friends.
+            for line in raw_line.splitlines():
+                line = line.rstrip()
+                h2_match = _H2_LINE.match(line)
+                if h2_match:
+                    current_h2 = h2_match.group(1).strip()
+                    continue
+                h3_match = _H3_LINE.match(line)
+                if h3_match:
+                    heading = h3_match.group(1).strip()
+                    if heading:
+                        h3_parent_map[heading].add(current_h2 or "__root__")
+
+        warnings = [
+            f"H2が重複しています: 「{heading}」が{count}回出現" for heading, count in h2_counts.items() if count > 1
+        ]
+        warnings.extend(
+            f"H3「{heading}」が複数のH2配下で使われています: {', '.join(parents)}"
+            for heading, parents in h3_parent_map.items()
+            if len(parents) > 1
+        )
+        warnings.extend(length_warnings)
+        warnings.extend(
+            f"「である調」が検出されました: {', '.join(found[:3])}" for found in style_matches if found
+        )
+        return warnings
@@ -1,9 +1,61 @@
 import json
+import os
+import threading
+import time
 
 import pytest
+from app.tasks import pipeline as pipeline_module
 from app.tasks.pipeline import DraftGenerationPipeline, PipelineContext
 
 
+def _make_context(**overrides) -> PipelineContext:
+    fields = {
+        "job_id": "job-1",
+        "draft_id": "draft-1",
+        "project_id": "proj",
+        "prompt_version": "v1",
+        "primary_keyword": "GA4",
+        "persona": {},
+        "intent": "information",
+        "article_type": "information",
+        "cta": None,
+        "heading_mode": "auto",
+        "heading_overrides": [],
+        "quality_rubric": None,
+        "reference_urls": [],
+        "output_format": "html",
+        "notation_guidelines": None,
+        "word_count_range": None,
+        "writer_persona": {},
+        "preferred_sources": [],
+        "reference_media": [],
+        "project_template_id": None,
+        "prompt_layers": {},
+        "llm_provider": "openai",
+        "llm_model": "gpt-5",
+        "llm_temperature": 0.7,
+        "serp_snapshot": [],
+        "serp_gap_topics": [],
+        "expertise_level": "intermediate",
+        "tone": "formal",
+        "site_context": [],
+        "post_publish_metrics": {},
+    }
+    fields.update(overrides)
+    return PipelineContext(**fields)
+
+
+class StubLinkRepository:
+    is_enabled = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def search(self, keyword, persona_goals, limit=5):
+        self.calls += 1
+        return [{"url": "https://example.jp/a", "title": "関連記事", "score": 0.5, "snippet": ""}]
+
+
 class TestDraftGenerationPipeline:
     def test_estimate_intent_explicit(self):
         """Test intent estimation with explicit intent."""
@@ -451,3 +503,340 @@ class TestDraftGenerationPipeline:
         assert result["metadata"]["provisional_title"] == result["outline"]["title"]
         assert result["metadata"]["final_title"]
         assert result["meta"].get("final_title") == result["metadata"]["final_title"]
+
+    def test_run_cancels_queued_side_tasks_when_a_step_fails(self, monkeypatch):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "llm_max_workers", 1)
+        release = threading.Event()
+        started = []
+
+        def blocking_conclusion(_context):
+            release.wait(timeout=5)
+            return {}
+
+        def failing_outline(_context, _payload):
+            raise RuntimeError("outline failed")
+
+        monkeypatch.setattr(pipeline, "extract_conclusion", blocking_conclusion)
+        monkeypatch.setattr(pipeline, "propose_links", lambda *_args: started.append("links") or [])
+        monkeypatch.setattr(pipeline, "_generate_faq", lambda _context: started.append("faq") or [])
+        monkeypatch.setattr(pipeline, "_draft_outline", failing_outline)
+        pipeline_module.shutdown_shared_executor()
+        try:
+            with pytest.raises(RuntimeError):
+                pipeline.run({"job_id": "job-1", "draft_id": "draft-1", "primary_keyword": "GA4"})
+            release.set()
+        finally:
+            pipeline_module.shutdown_shared_executor()
+
+        assert started == []
+
+    def test_propose_links_reuses_cached_search(self):
+        pipeline_module._LINK_SEARCH_CACHE.clear()
+        repository = StubLinkRepository()
+        context = _make_context(persona={"goals": ["CV改善", "計測設計"]})
+        payload = {"primary_keyword": "GA4 設定"}
+
+        first = DraftGenerationPipeline()
+        first.link_repository = repository
+        second = DraftGenerationPipeline()
+        second.link_repository = repository
+        reordered = _make_context(persona={"goals": ["計測設計", "CV改善"]})
+
+        assert first.propose_links(payload, context)[0]["url"] == "https://example.jp/a"
+        assert second.propose_links(payload, reordered)[0]["title"] == "関連記事"
+        assert repository.calls == 1
+        pipeline_module._LINK_SEARCH_CACHE.clear()
+
+    def test_template_outline_is_not_shared_between_calls(self):
+        pipeline = DraftGenerationPipeline()
+        context = _make_context(primary_keyword="SEO対策", word_count_range="2000-2400")
+        payload = {"primary_keyword": "SEO対策"}
+
+        first = pipeline.generate_outline(context, payload)
+        first["h2"][0]["h3"][0]["estimated_words"] = 9999
+        first["h2"][0]["text"] = "変更済み"
+        second = pipeline.generate_outline(context, payload)
+
+        assert second["h2"][0]["text"] != "変更済み"
+        assert second["h2"][0]["h3"][0]["estimated_words"] != 9999
+        assert "SEO対策" in second["h2"][0]["text"]
+
+    def test_pipelines_share_link_repository(self):
+        assert pipeline_module._get_link_repository() is pipeline_module._get_link_repository()
+
+    def test_reused_pipeline_picks_up_recovered_link_repository(self, monkeypatch):
+        class DisabledRepository:
+            is_enabled = False
+
+        pipeline_module._LINK_SEARCH_CACHE.clear()
+        pipeline = DraftGenerationPipeline()
+        context = _make_context(persona={"goals": ["CV改善"]})
+        payload = {"primary_keyword": "GA4 設定"}
+        monkeypatch.setattr(pipeline_module, "_LINK_REPOSITORY", DisabledRepository())
+        monkeypatch.setattr(pipeline_module, "_LINK_REPOSITORY_RETRY_AT", float("inf"))
+        monkeypatch.setattr(pipeline_module, "InternalLinkRepository", StubLinkRepository)
+
+        assert pipeline.propose_links(payload, context) == []
+
+        monkeypatch.setattr(pipeline_module, "_LINK_REPOSITORY_RETRY_AT", 0.0)
+        assert pipeline.propose_links(payload, context)[0]["url"] == "https://example.jp/a"
+        pipeline_module._LINK_SEARCH_CACHE.clear()
+
+    def test_disabled_link_repository_is_retried_after_interval(self, monkeypatch):
+        class DisabledRepository:
+            is_enabled = False
+
+        disabled = DisabledRepository()
+        monkeypatch.setattr(pipeline_module, "_LINK_REPOSITORY", disabled)
+        monkeypatch.setattr(pipeline_module, "_LINK_REPOSITORY_RETRY_AT", float("inf"))
+        assert pipeline_module._get_link_repository() is disabled
+
+        monkeypatch.setattr(pipeline_module, "_LINK_REPOSITORY_RETRY_AT", 0.0)
+        assert pipeline_module._get_link_repository() is not disabled
+
+    def test_prioritize_sources_prefers_matching_domains(self):
+        sources = [
+            {"url": "https://blog.example.com/post"},
+            {"uri": "https://www.MHLW.go.jp/stats"},
+            {"title": "Example Docs"},
+        ]
+        preferred = ["mhlw.go.jp", "Example Docs"]
+        matcher = DraftGenerationPipeline._compile_source_matcher(preferred)
+
+        ordered = DraftGenerationPipeline._prioritize_sources(sources, preferred, matcher)
+
+        assert ordered == [sources[1], sources[2], sources[0]]
+        assert DraftGenerationPipeline._prioritize_sources(sources, preferred) == ordered
+        assert DraftGenerationPipeline._compile_source_matcher([]) is None
+
+    def test_generate_draft_batches_h3_paragraphs_per_section(self, monkeypatch):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "batch_h3_per_h2", True)
+        calls = []
+
+        def fake_generate(*, messages, **_kwargs):
+            calls.append(messages)
+            if "H3見出しについて" not in messages[-1]["content"]:
+                return {"text": "個別の本文", "citations": []}
+            return {
+                "text": json.dumps({"paragraphs": [{"heading": "A", "text": "本文A"}, {"heading": "B", "text": "本文B"}]}),
+                "citations": [{"url": "https://example.jp/src"}],
+            }
+
+        monkeypatch.setattr(pipeline, "_generate_grounded_content", fake_generate)
+        monkeypatch.setattr(pipeline, "_generate_faq", lambda _context: [])
+        outline = {"h2": [{"text": "見出し", "h3": [{"text": "A"}, {"text": "B"}]}, {"text": "単独", "h3": []}]}
+
+        draft = pipeline.generate_draft(_make_context(), outline, [])
+
+        assert len(calls) == 2
+        assert [p["text"] for p in draft["sections"][0]["paragraphs"]] == ["本文A", "本文B"]
+        assert draft["sections"][0]["paragraphs"][1]["citations"] == ["https://example.jp/src"]
+        assert draft["sections"][1]["paragraphs"][0]["text"] == "個別の本文"
+
+    def test_generate_draft_falls_back_to_per_h3_calls_on_bad_batch_json(self, monkeypatch):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "batch_h3_per_h2", True)
+        calls = []
+
+        def fake_generate(*, messages, log_info, **_kwargs):
+            calls.append(log_info["stage"])
+            if log_info["stage"] == "generate_draft_batch":
+                return {"text": "JSONではない応答", "citations": []}
+            return {"text": f"{log_info['heading']}の本文", "citations": []}
+
+        monkeypatch.setattr(pipeline, "_generate_grounded_content", fake_generate)
+        monkeypatch.setattr(pipeline, "_generate_faq", lambda _context: [])
+        outline = {"h2": [{"text": "見出し", "h3": [{"text": "A"}, {"text": "B"}]}]}
+
+        draft = pipeline.generate_draft(_make_context(), outline, [])
+
+        assert calls == ["generate_draft_batch", "generate_draft", "generate_draft"]
+        assert [p["heading"] for p in draft["sections"][0]["paragraphs"]] == ["A", "B"]
+
+    def test_generate_draft_falls_back_to_per_h3_calls_when_batch_raises(self, monkeypatch):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "batch_h3_per_h2", True)
+        calls = []
+
+        def fake_generate(*, messages, log_info, **_kwargs):
+            calls.append(log_info["stage"])
+            if log_info["stage"] == "generate_draft_batch":
+                raise RuntimeError("upstream timeout")
+            return {"text": f"{log_info['heading']}の本文", "citations": []}
+
+        monkeypatch.setattr(pipeline, "_generate_grounded_content", fake_generate)
+        monkeypatch.setattr(pipeline, "_generate_faq", lambda _context: [])
+        outline = {"h2": [{"text": "見出し", "h3": [{"text": "A"}, {"text": "B"}, {"text": "C"}]}]}
+
+        draft = pipeline.generate_draft(_make_context(), outline, [])
+
+        assert sorted(calls) == ["generate_draft", "generate_draft", "generate_draft", "generate_draft_batch"]
+        assert [p["heading"] for p in draft["sections"][0]["paragraphs"]] == ["A", "B", "C"]
+        assert len(draft["claims"]) == 3
+
+    def test_generate_faq_on_a_saturated_shared_executor_does_not_deadlock(self, monkeypatch):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "llm_max_workers", 1)
+        monkeypatch.setattr(pipeline, "max_workers", 2)
+        monkeypatch.setattr(
+            pipeline,
+            "_generate_grounded_content",
+            lambda *, log_info, **_kwargs: {"text": f"{log_info['heading']}の回答", "citations": []},
+        )
+        pipeline_module.shutdown_shared_executor()
+        try:
+            future = pipeline_module._shared_executor().submit(
+                pipeline._generate_faq, _make_context(persona={"pain_points": ["時間", "費用", "手間"]})
+            )
+            faq = future.result(timeout=5)
+        finally:
+            pipeline_module.shutdown_shared_executor()
+
+        assert [item["answer"] for item in faq] == ["FAQ: 時間の回答", "FAQ: 費用の回答", "FAQ: 手間の回答"]
+
+    def test_generate_grounded_content_reuses_cached_response(self, monkeypatch, tmp_path):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "llm_cache_enabled", True)
+        monkeypatch.setattr(pipeline.settings, "llm_cache_dir", str(tmp_path))
+        calls = []
+
+        class StubGateway:
+            provider = "openai"
+            model = "gpt-5"
+
+            def generate_with_grounding(self, **kwargs):
+                calls.append(kwargs)
+                return {"text": "本文", "citations": [{"url": "https://example.jp/src"}]}
+
+        monkeypatch.setattr(pipeline, "ai_gateway", StubGateway())
+        messages = [{"role": "user", "content": "見出し"}]
+
+        first = pipeline._generate_grounded_content(messages=messages, temperature=0.0)
+        second = pipeline._generate_grounded_content(messages=messages, temperature=0.0)
+        pipeline._generate_grounded_content(messages=messages, temperature=0.7)
+        pipeline._generate_grounded_content(messages=messages, temperature=0.7)
+
+        assert first == second
+        assert len(calls) == 3
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_response_cache_expires_stale_entries(self, monkeypatch, tmp_path):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "llm_cache_enabled", True)
+        monkeypatch.setattr(pipeline.settings, "llm_cache_dir", str(tmp_path))
+        monkeypatch.setattr(pipeline.settings, "llm_cache_ttl_seconds", 60)
+
+        path = pipeline._response_cache_path("prompt", None, 0.0, None)
+        pipeline._write_cached_response(path, {"text": "本文"})
+
+        assert pipeline._read_cached_response(path) == {"text": "本文"}
+        os.utime(path, (time.time() - 120, time.time() - 120))
+        assert pipeline._read_cached_response(path) is None
+        assert not path.exists()
+
+    def test_response_cache_evicts_oldest_entries_without_scanning_every_write(self, monkeypatch, tmp_path):
+        pipeline = DraftGenerationPipeline()
+        monkeypatch.setattr(pipeline.settings, "llm_cache_enabled", True)
+        monkeypatch.setattr(pipeline.settings, "llm_cache_dir", str(tmp_path))
+        monkeypatch.setattr(pipeline.settings, "llm_cache_max_entries", 10)
+        scans = []
+        scan_entries = DraftGenerationPipeline._cached_response_entries
+        monkeypatch.setattr(
+            DraftGenerationPipeline,
+            "_cached_response_entries",
+            staticmethod(lambda cache_dir: scans.append(cache_dir) or scan_entries(cache_dir)),
+        )
+
+        paths = [pipeline._response_cache_path(f"prompt {index}", None, 0.0, None) for index in range(11)]
+        for index, path in enumerate(paths):
+            pipeline._write_cached_response(path, {"text": path.stem})
+            os.utime(path, (time.time() - 1000 + index, time.time() - 1000 + index))
+        pipeline._write_cached_response(paths[-1], {"text": "上書き"})
+
+        assert len(scans) == 2
+        assert [path.exists() for path in paths] == [False, False] + [True] * 9
+
+    def test_prompt_static_prerenders_heading_independent_layers(self):
+        pipeline = DraftGenerationPipeline()
+        context = _make_context(
+            prompt_layers={"system": "S {writer_name}", "developer": "D {heading}", "user": "U {heading} {section_goal}"},
+        )
+
+        static = pipeline._precompute_prompt_static(context)
+        messages = pipeline._build_prompt_messages("見出しA", "h3", context, section_goal="G", static=static)
+
+        assert static.system_message is not None
+        assert static.developer_message is None
+        assert messages[1]["content"].startswith("D 見出しA")
+        assert "U 見出しA G" in messages[2]["content"]
+
+
+def test_validate_all_matches_individual_checks():
+    from app.validators import StructureValidator
+
+    markdown = "\n".join(
+        [
+            "## 概要",
+            "### 定義",
+            "これは重要な指標である。" + "長い説明" * 25 + "。",
+            "## 概要",
+            "### 定義",
+            "運用の要はここにある。短い文です。",
+        ]
+    )
+
+    expected = (
+        StructureValidator.validate_headings(markdown)
+        + StructureValidator.validate_sentence_length(markdown)
+        + StructureValidator.check_style_consistency(markdown)
+    )
+
+    assert expected
+    assert StructureValidator.validate_all(markdown) == expected
+
+
+def test_handle_pubsub_message_runs_within_delivery_and_skips_redelivery(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_run(self, payload):
+        started.set()
+        release.wait(timeout=5)
+        return {"metadata": {"job_id": payload["job_id"]}}
+
+    monkeypatch.setattr(DraftGenerationPipeline, "run", fake_run)
+    event = {"data": json.dumps({"job_id": "job-ps", "draft_id": "draft-ps"})}
+    results = []
+    delivery = threading.Thread(target=lambda: results.append(pipeline_module.handle_pubsub_message(event, None)))
+    delivery.start()
+
+    assert started.wait(timeout=5)
+    assert pipeline_module.handle_pubsub_message(event, None)["status"] == "duplicate"
+
+    release.set()
+    delivery.join(timeout=5)
+    assert results == [{"metadata": {"job_id": "job-ps"}}]
+    assert "draft-ps" not in pipeline_module._PUBSUB_INFLIGHT
+
+
+def test_handle_pubsub_message_propagates_failures_and_rejects_missing_ids(monkeypatch):
+    def failing_run(self, payload):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(DraftGenerationPipeline, "run", failing_run)
+
+    with pytest.raises(RuntimeError):
+        pipeline_module.handle_pubsub_message({"data": json.dumps({"job_id": "job-fail"})}, None)
+    assert "job-fail" not in pipeline_module._PUBSUB_INFLIGHT
+    assert pipeline_module.handle_pubsub_message({"data": json.dumps({})}, None)["status"] == "rejected"
+    draft_only = pipeline_module.handle_pubsub_message({"data": json.dumps({"draft_id": "d1"})}, None)
+    assert draft_only == {"status": "rejected", "reason": "missing_job_id"}
+
+
+def test_search_fallback_url_quotes_keyword():
+    url = pipeline_module._search_fallback_url("SEO 対策 & ツール")
+
+    assert url.startswith("https://www.google.com/search?q=SEO+")
+    assert " " not in url and "&" not in url.split("?", 1)[1]